@@ -24,7 +24,6 @@ import asyncio
 import signal
 import time
 import weakref
-import yaml
 import structlog
 from pathlib import Path
 
@@ -156,8 +155,8 @@ class NexusAgent:
         config_path = Path(path)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        from core.config import load_yaml_cached  # Keeps pydantic off the import path
+        return load_yaml_cached(config_path)
 
     # ═══════════════════════════════════════════════════════
     #  LIFECYCLE
@@ -370,7 +369,7 @@ class NexusAgent:
 
         if detected:
             # Update the game reader's regions
-            self.game_reader.regions.update(detected)
+            self.game_reader.update_regions(detected)
 
             # Update minimap center for navigator
             minimap_config = calibrator.get_minimap_center(detected)
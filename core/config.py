@@ -12,8 +12,10 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 import yaml
@@ -21,6 +23,21 @@ from pydantic import BaseModel, Field, field_validator
 
 log = structlog.get_logger()
 
+# Parsed-YAML cache: one JSON file per source path, under the user's home
+# rather than next to the YAML — settings.yaml holds API keys, and a sidecar
+# in the checkout could end up committed
+YAML_CACHE_DIR = Path.home() / ".nexus" / "yaml_cache"
+
+try:
+    import orjson
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+except ImportError:  # orjson ships with the "fast" extra
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 
 # ─── Sub-models ─────────────────────────────────────────
 
@@ -168,6 +185,46 @@ class NexusConfig(BaseModel):
 
 # ─── Loader ─────────────────────────────────────────────
 
+def load_yaml_cached(path: str | Path) -> Any:
+    """
+    yaml.safe_load() a file, served from a JSON copy while its content is unchanged.
+
+    The cache entry stores a blake2b digest of the YAML bytes, so any edit
+    invalidates it (no mtime granularity issues). Documents that don't
+    survive a JSON round trip unchanged (dates, non-string keys) are
+    simply parsed every time.
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    name = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    cache = YAML_CACHE_DIR / f"{name}.json"
+
+    try:
+        entry = _json_loads(cache.read_bytes())
+        if entry["digest"] == digest:
+            return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = yaml.safe_load(raw)
+
+    try:
+        blob = _json_dumps({"digest": digest, "data": data})
+    except (TypeError, ValueError):
+        return data
+    if _json_loads(blob)["data"] != data:
+        return data
+    try:
+        YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd = os.open(cache, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+    except OSError as e:
+        log.debug("config.yaml_cache_write_failed", path=str(cache), error=str(e))
+    return data
+
+
 def load_config(path: str | Path = "config/settings.yaml") -> NexusConfig:
     """
     Load and validate NEXUS config from YAML file.
@@ -183,7 +240,7 @@ def load_config(path: str | Path = "config/settings.yaml") -> NexusConfig:
         return NexusConfig()
 
     try:
-        raw = yaml.safe_load(path.read_text()) or {}
+        raw = load_yaml_cached(path) or {}
     except yaml.YAMLError as e:
         log.error("config.yaml_parse_error", path=str(path), error=str(e))
         raise
@@ -26,8 +26,10 @@ async def run(agent: NexusAgent) -> None:
         try:
             elapsed_hours = agent.state.session_duration_minutes / 60
             if elapsed_hours > 0:
-                agent.state.session.xp_per_hour = agent.state.session.xp_gained / elapsed_hours
-                agent.state.session.profit_per_hour = agent.state.session.loot_value / elapsed_hours
+                agent.state.update_session_rates(
+                    agent.state.session.xp_gained / elapsed_hours,
+                    agent.state.session.loot_value / elapsed_hours,
+                )
 
             # Build metrics dict safely — avoid crashing on None attributes
             reasoning_action = "unknown"
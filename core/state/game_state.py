@@ -51,11 +51,11 @@ class GameState:
         # Agent state
         self.mode: AgentMode = AgentMode.IDLE
         self.threat_level: ThreatLevel = ThreatLevel.NONE
-        self.is_alive: bool = True
+        self._is_alive: bool = True
 
         # Creatures & players on screen
         self.battle_list: list[CreatureState] = []
-        self.current_target: Optional[CreatureState] = None
+        self._current_target: Optional[CreatureState] = None
         self.nearby_players: list[CreatureState] = []
 
         # Supplies
@@ -68,7 +68,7 @@ class GameState:
         self.session: SessionMetrics = SessionMetrics(start_time=time.time())
 
         # Active skill info
-        self.active_skill: Optional[str] = None
+        self._active_skill: Optional[str] = None
         self.current_waypoint_index: int = 0
 
         # Cooldowns (spell_name -> timestamp when available)
@@ -83,6 +83,48 @@ class GameState:
         self._mode_set_at: float = 0.0
         self._mode_commit_seconds: float = 10.0  # Minimum time to stay in a mode
 
+        # Change counter — bumped by every update_*/set_mode notification
+        # and by the plain-attribute setters below; lets readers (e.g. the
+        # TUI) skip rebuilding views of unchanged state
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter of notified state changes."""
+        return self._version
+
+    # Fields written directly by skills/perception/recovery rather than via
+    # an update_* method — setters keep version in step with them.
+    @property
+    def is_alive(self) -> bool:
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        if value != self._is_alive:
+            self._is_alive = value
+            self._version += 1
+
+    @property
+    def current_target(self) -> Optional[CreatureState]:
+        return self._current_target
+
+    @current_target.setter
+    def current_target(self, value: Optional[CreatureState]):
+        if value is not self._current_target:
+            self._current_target = value
+            self._version += 1
+
+    @property
+    def active_skill(self) -> Optional[str]:
+        return self._active_skill
+
+    @active_skill.setter
+    def active_skill(self, value: Optional[str]):
+        if value != self._active_skill:
+            self._active_skill = value
+            self._version += 1
+
     @property
     def hp_percent(self) -> float:
         if self.hp_max == 0:
@@ -143,6 +185,12 @@ class GameState:
 
             self._notify("battle_list_changed")
 
+    def update_session_rates(self, xp_per_hour: float, profit_per_hour: float):
+        with self._lock:
+            self.session.xp_per_hour = xp_per_hour
+            self.session.profit_per_hour = profit_per_hour
+            self._notify("session_rates_changed")
+
     def update_supplies(self, supplies: SupplyCount):
         with self._lock:
             self.supplies = supplies
@@ -268,6 +316,7 @@ class GameState:
         self._listeners[event].append(callback)
 
     def _notify(self, event: str, data: dict = None):
+        self._version += 1
         # Copy to avoid issues if listeners modify the list during iteration
         callbacks = self._listeners.get(event, [])[:]
         for callback in callbacks:
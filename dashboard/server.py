@@ -34,6 +34,17 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# WebSocket payload encoder: orjson (the "fast" extra) when installed —
+# several times faster than json.dumps on the 500ms state broadcast.
+# Frames must stay text, so the bytes are decoded back to str.
+try:
+    import orjson
+except ImportError:
+    _dumps = json.dumps
+else:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 DASHBOARD_HTML = Path(__file__).parent / "app.html"
 
 
@@ -248,7 +259,7 @@ class DashboardServer:
         self._ws_clients.append(ws)
         log.info("dashboard.ws_connected", clients=len(self._ws_clients))
 
-        await ws.send_json({"type": "state", "data": self._build_state_payload()})
+        await ws.send_json({"type": "state", "data": self._build_state_payload()}, dumps=_dumps)
 
         try:
             async for msg in ws:
@@ -260,7 +271,8 @@ class DashboardServer:
                                 data.get("command", ""),
                                 data.get("params", {}),
                             )
-                            await ws.send_json({"type": "command_result", "data": result})
+                            await ws.send_json({"type": "command_result", "data": result},
+                                               dumps=_dumps)
                     except json.JSONDecodeError:
                         pass
                 elif msg.type == web.WSMsgType.ERROR:
@@ -278,7 +290,7 @@ class DashboardServer:
             try:
                 if self._ws_clients:
                     payload = {"type": "state", "data": self._build_state_payload()}
-                    payload_json = json.dumps(payload)
+                    payload_json = _dumps(payload)
 
                     dead = []
                     for ws in self._ws_clients:
@@ -8,7 +8,7 @@ Architecture:
     - 3 screens: GameSelect (F1), Monitor (F2), Skills (F3)
     - Data flow: EventBus subscription + GameState polling (250ms)
     - Demo mode when agent=None (stable incremental simulation)
-    - Thread-safe event buffer for cross-thread agent events
+    - Agent events: lock-free SimpleQueue, drained + formatted on the UI loop
 
 Usage:
     nexus start          → TUI as default interface
@@ -17,8 +17,9 @@ Usage:
 
 from __future__ import annotations
 
-import threading
 import time
+from collections import deque
+from queue import Empty, SimpleQueue
 from typing import Optional, TYPE_CHECKING
 
 from textual import on, work
@@ -134,6 +135,35 @@ Screen {
 """
 
 
+# ═══════════════════════════════════════════════════════
+#  Static markup (parsed once at import)
+# ═══════════════════════════════════════════════════════
+
+_BANNER = Text.from_markup(
+    "[bold cyan]"
+    "    ███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗\n"
+    "    ████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝\n"
+    "    ██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗\n"
+    "    ██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║\n"
+    "    ██║ ╚████║███████╗██╔╝ ╚██╗╚██████╔╝███████║\n"
+    "    ╚═╝  ╚═══╝╚══════╝╚═╝   ╚═╝ ╚═════╝╚══════╝\n"
+    "[/bold cyan]\n"
+    "    [dim]Select a game to start the agent[/dim]\n"
+)
+
+_HEADER_TITLE = Text.from_markup("[bold cyan]NEXUS[/bold cyan] v0.4.2")
+_SKILLS_HEADER = Text.from_markup("[bold cyan]Skills[/bold cyan]\n")
+
+_STATUS_LIVE = Text.from_markup("[green]● LIVE[/green]")
+_STATUS_DEMO = Text.from_markup("[yellow]● DEMO[/yellow]")
+_STATUS_DEAD = Text.from_markup("[red]● DEAD[/red]")
+_STATUS_CB_OPEN = Text.from_markup("[red]● CB OPEN[/red]")
+_STATUS_THREAT = {
+    threat: Text.from_markup(f"[red]● THREAT {threat}[/red]")
+    for threat in ("HIGH", "CRITICAL")
+}
+
+
 # ═══════════════════════════════════════════════════════
 #  Screen: Game Select
 # ═══════════════════════════════════════════════════════
@@ -147,18 +177,7 @@ class GameSelectScreen(Screen):
     ]
 
     def compose(self) -> ComposeResult:
-        yield Static(
-            "[bold cyan]"
-            "    ███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗\n"
-            "    ████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝\n"
-            "    ██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗\n"
-            "    ██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║\n"
-            "    ██║ ╚████║███████╗██╔╝ ╚██╗╚██████╔╝███████║\n"
-            "    ╚═╝  ╚═══╝╚══════╝╚═╝   ╚═╝ ╚═════╝╚══════╝\n"
-            "[/bold cyan]\n"
-            "    [dim]Select a game to start the agent[/dim]\n",
-            id="game-select-title",
-        )
+        yield Static(_BANNER, id="game-select-title")
         with Horizontal(id="game-grid"):
             yield GameCard(
                 game_id="tibia",
@@ -183,13 +202,16 @@ class GameSelectScreen(Screen):
             )
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Screens are only ever hosted by NexusTUI — resolve it once
+        self._nexus_app: NexusTUI = self.app  # type: ignore[assignment]
+
     @on(GameCard.Selected)
     def on_game_selected(self, event: GameCard.Selected) -> None:
         """A ready game card was clicked — switch to monitor."""
-        app = self.app
-        if isinstance(app, NexusTUI):
-            app._game = event.game_id
-            app.switch_screen("monitor")
+        app = self._nexus_app
+        app._game = event.game_id
+        app.switch_screen("monitor")
 
 
 # ═══════════════════════════════════════════════════════
@@ -209,10 +231,10 @@ class MonitorScreen(Screen):
     def compose(self) -> ComposeResult:
         # Custom header
         with Horizontal(id="nexus-header"):
-            yield Static("[bold cyan]NEXUS[/bold cyan] v0.4.2", id="header-title")
+            yield Static(_HEADER_TITLE, id="header-title")
             yield ModeIndicator(id="header-mode")
             yield Static("⏱ 0:00:00", id="header-uptime")
-            yield Static("[green]● LIVE[/green]", id="header-status")
+            yield Static(_STATUS_LIVE, id="header-status")
 
         # 3x2 grid layout
         with Grid(id="monitor-grid"):
@@ -246,67 +268,71 @@ class MonitorScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Screens are only ever hosted by NexusTUI — resolve it once
+        self._nexus_app: NexusTUI = self.app  # type: ignore[assignment]
+
+        # Header widgets are fixed for the screen's lifetime — query once
+        self._w_header_mode = self.query_one("#header-mode", ModeIndicator)
+        self._w_uptime = self.query_one("#header-uptime", Static)
+        self._w_status = self.query_one("#header-status", Static)
+        self._last_uptime: str = ""
+
     def update_state(self, state: TUIState) -> None:
         """Push new state to all widgets."""
         try:
-            # Vitals
-            self.query_one("#bar-hp", VitalBar).update_value(state.hp)
-            self.query_one("#bar-mana", VitalBar).update_value(state.mana)
-
-            # Mode & Threat
-            self.query_one("#header-mode", ModeIndicator).mode = state.mode
-            self.query_one("#mode-display", ModeIndicator).mode = state.mode
-            self.query_one("#threat-display", ThreatIndicator).threat = state.threat
-
-            # Position
-            x, y, z = state.position
-            self.query_one("#position-display", Static).update(
-                Text.from_markup(f" Pos [cyan]({x}, {y}, {z})[/cyan]")
-            )
-
-            # Active skill
-            self.query_one("#skill-display", Static).update(
-                Text.from_markup(f" Skill [dim]{state.active_skill}[/dim]")
-            )
-
-            # Uptime
-            secs = state.uptime_seconds or int(state.duration_min * 60)
-            h, rem = divmod(secs, 3600)
-            m, s = divmod(rem, 60)
-            self.query_one("#header-uptime", Static).update(f"⏱ {h}:{m:02d}:{s:02d}")
-
-            # Status indicator
-            status_widget = self.query_one("#header-status", Static)
-            if state.circuit_breaker == "OPEN":
-                status_widget.update("[red]● CB OPEN[/red]")
-            elif state.threat in ("HIGH", "CRITICAL"):
-                status_widget.update(f"[red]● THREAT {state.threat}[/red]")
-            elif not state.is_alive:
-                status_widget.update("[red]● DEAD[/red]")
-            else:
-                app = self.app
-                demo = isinstance(app, NexusTUI) and app._demo_mode
-                status_widget.update("[yellow]● DEMO[/yellow]" if demo else "[green]● LIVE[/green]")
+            # One repaint for the whole push instead of one per widget
+            with self._nexus_app.batch_update():
+                # Vitals
+                self.query_one("#bar-hp", VitalBar).update_value(state.hp)
+                self.query_one("#bar-mana", VitalBar).update_value(state.mana)
+
+                # Mode & Threat
+                self._w_header_mode.mode = state.mode
+                self.query_one("#mode-display", ModeIndicator).mode = state.mode
+                self.query_one("#threat-display", ThreatIndicator).threat = state.threat
+
+                # Position & active skill (renderables memoized on the state)
+                self.query_one("#position-display", Static).update(state.position_text)
+                self.query_one("#skill-display", Static).update(state.skill_text)
+
+                # Uptime (second resolution — most polls land in the same second)
+                uptime = state.uptime_str
+                if uptime != self._last_uptime:
+                    self._last_uptime = uptime
+                    self._w_uptime.update(uptime)
+
+                # Status indicator
+                status_widget = self._w_status
+                if state.circuit_breaker == "OPEN":
+                    status_widget.update(_STATUS_CB_OPEN)
+                elif state.threat in _STATUS_THREAT:
+                    status_widget.update(_STATUS_THREAT[state.threat])
+                elif not state.is_alive:
+                    status_widget.update(_STATUS_DEAD)
+                else:
+                    demo = self._nexus_app._demo_mode
+                    status_widget.update(_STATUS_DEMO if demo else _STATUS_LIVE)
 
-            # Events
-            self.query_one("#event-stream", EventStream).set_events(state.events)
+                # Events
+                self.query_one("#event-stream", EventStream).set_events(state.events)
 
-            # Battle
-            self.query_one("#battle-list", BattleListWidget).update_data(
-                state.battle_list, state.target
-            )
+                # Battle
+                self.query_one("#battle-list", BattleListWidget).update_data(
+                    state.battle_list, state.target
+                )
 
-            # Stats panels
-            self.query_one("#session-stats", SessionStats).update_stats(state)
-            self.query_one("#brain-stats", BrainStats).update_stats(state)
-            self.query_one("#consciousness-panel", ConsciousnessPanel).update_data(state)
+                # Stats panels
+                self.query_one("#session-stats", SessionStats).update_stats(state)
+                self.query_one("#brain-stats", BrainStats).update_stats(state)
+                self.query_one("#consciousness-panel", ConsciousnessPanel).update_data(state)
 
         except Exception:
             pass  # Widget may not be mounted yet during screen transitions
 
     def action_toggle_pause(self) -> None:
-        app = self.app
-        if isinstance(app, NexusTUI) and app.agent:
+        app = self._nexus_app
+        if app.agent:
             from core.state.enums import AgentMode
             if app.agent.state.mode == AgentMode.PAUSED:
                 app.agent.state.set_mode(AgentMode.HUNTING)
@@ -314,9 +340,8 @@ class MonitorScreen(Screen):
                 app.agent.state.set_mode(AgentMode.PAUSED)
 
     def action_toggle_demo(self) -> None:
-        app = self.app
-        if isinstance(app, NexusTUI):
-            app._demo_mode = not app._demo_mode
+        app = self._nexus_app
+        app._demo_mode = not app._demo_mode
 
 
 # ═══════════════════════════════════════════════════════
@@ -333,7 +358,7 @@ class SkillsScreen(Screen):
 
     def compose(self) -> ComposeResult:
         with Vertical(id="skills-container"):
-            yield Static("[bold cyan]Skills[/bold cyan]\n", id="skills-header")
+            yield Static(_SKILLS_HEADER, id="skills-header")
             yield Static("", id="skills-content")
         yield Footer()
 
@@ -392,6 +417,46 @@ class SkillsScreen(Screen):
             widget.update(Text.from_markup("\n".join(lines) + "\n\n [dim](Demo mode)[/dim]"))
 
 
+# ═══════════════════════════════════════════════════════
+#  Agent event formatting
+# ═══════════════════════════════════════════════════════
+
+# Events that fire every frame/tick — never shown in the stream
+_NOISY_EVENTS = frozenset({"hp_changed", "mana_changed", "state_updated", "frame_captured"})
+
+
+def _format_event(etype: str, data: dict) -> str:
+    """Format a raw agent event as a one-line event-stream entry."""
+    if etype == "kill":
+        return f"kill: {data.get('creature', '?')}"
+    elif etype == "death":
+        return f"death: {data.get('cause', '?')}"
+    elif etype == "mode_changed":
+        new_mode = data.get("new", "?")
+        if hasattr(new_mode, "name"):
+            new_mode = new_mode.name
+        return f"mode: {new_mode}"
+    elif etype == "creature_spotted":
+        return f"spot: {data.get('name', '?')}"
+    elif etype == "player_spotted":
+        return f"player: {data.get('name', '?')}"
+    elif etype == "skill_activated":
+        return f"skill: {data.get('name', '?')}"
+    elif etype == "strategic_decision":
+        return f"brain: {data.get('action', 'decision')}"
+    elif etype == "close_call":
+        return f"CLOSE CALL: HP {data.get('hp', '?')}%"
+    elif etype == "exploration_started":
+        return "explore: started"
+    elif etype == "exploration_stopped":
+        return "explore: stopped"
+    elif etype == "error":
+        return f"error: {str(data.get('message', '?'))[:40]}"
+    elif etype in ("agent_started", "agent_stopping"):
+        return f"system: {etype.replace('_', ' ')}"
+    return f"{etype}: {str(data)[:30]}"
+
+
 # ═══════════════════════════════════════════════════════
 #  Main App
 # ═══════════════════════════════════════════════════════
@@ -443,12 +508,18 @@ class NexusTUI(App):
         self._poll_timer: Optional[Timer] = None
         self._start_time = time.time()
 
-        # Thread-safe event buffer (agent events come from agent thread)
-        self._event_lock = threading.Lock()
-        self._event_buffer: list[str] = []
+        # Agent events: producers enqueue raw (type, data) on _event_q;
+        # the UI loop drains + formats into the bounded _event_buffer.
+        self._event_q: SimpleQueue[tuple[str, dict]] = SimpleQueue()
+        self._event_buffer: deque[str] = deque(maxlen=50)
 
         # Stable demo simulator (no flickering)
         self._demo_sim = DemoSimulator()
+        self._demo_state = self._demo_sim.initial_state()
+        self._demo_skipped = 0  # Demo polls missed while on the skills screen
+
+        # Live mode: one long-lived state refreshed in place each poll
+        self._live_state = TUIState(events=self._event_buffer)
 
     def on_mount(self) -> None:
         """Called when app is ready."""
@@ -493,84 +564,71 @@ class NexusTUI(App):
         """
         Callback for all agent events — feed into event stream.
 
-        THREAD SAFETY: This may be called from the agent's thread,
-        so we use a lock to protect _event_buffer.
+        Kept minimal: the raw (type, data) pair is enqueued on a SimpleQueue
+        (C-implemented, lock-free put) and formatted later on the UI loop by
+        _drain_events(), so the emitting side returns immediately — whichever
+        thread it runs on.
         """
         try:
             etype = event.type.name.lower()
-            data = event.data or {}
-
-            # Format event for display
-            if etype == "kill":
-                text = f"kill: {data.get('creature', '?')}"
-            elif etype == "death":
-                text = f"death: {data.get('cause', '?')}"
-            elif etype in ("hp_changed", "mana_changed", "state_updated", "frame_captured"):
+            if etype in _NOISY_EVENTS:
                 return  # Too frequent, skip
-            elif etype == "mode_changed":
-                new_mode = data.get("new", "?")
-                if hasattr(new_mode, "name"):
-                    new_mode = new_mode.name
-                text = f"mode: {new_mode}"
-            elif etype == "creature_spotted":
-                text = f"spot: {data.get('name', '?')}"
-            elif etype == "player_spotted":
-                text = f"player: {data.get('name', '?')}"
-            elif etype == "skill_activated":
-                text = f"skill: {data.get('name', '?')}"
-            elif etype == "strategic_decision":
-                text = f"brain: {data.get('action', 'decision')}"
-            elif etype == "close_call":
-                text = f"CLOSE CALL: HP {data.get('hp', '?')}%"
-            elif etype == "exploration_started":
-                text = f"explore: started"
-            elif etype == "exploration_stopped":
-                text = f"explore: stopped"
-            elif etype == "error":
-                text = f"error: {str(data.get('message', '?'))[:40]}"
-            elif etype in ("agent_started", "agent_stopping"):
-                text = f"system: {etype.replace('_', ' ')}"
-            else:
-                text = f"{etype}: {str(data)[:30]}"
-
-            self._push_event(text)
-
+            self._event_q.put_nowait((etype, event.data))
         except Exception:
             pass  # Never crash the event handler
 
-    def _push_event(self, text: str) -> None:
-        """Thread-safe append to event buffer."""
-        with self._event_lock:
-            self._event_buffer.insert(0, text)
-            if len(self._event_buffer) > 50:
-                self._event_buffer = self._event_buffer[:50]
+    def _drain_events(self) -> None:
+        """Format all queued agent events into the event buffer (UI loop)."""
+        q = self._event_q
+        push = self._push_event
+        while True:
+            try:
+                etype, data = q.get_nowait()
+            except Empty:
+                break
+            try:
+                push(_format_event(etype, data or {}))
+            except Exception:
+                pass  # One malformed event must not stall the drain
 
-    def _get_events(self) -> list[str]:
-        """Thread-safe read of event buffer."""
-        with self._event_lock:
-            return self._event_buffer.copy()
+    def _push_event(self, text: str) -> None:
+        """Append to event buffer (newest first, oldest dropped at maxlen)."""
+        self._event_buffer.appendleft(text)
+        if self._demo_mode:
+            # Surface real events (e.g. "error: Agent failed") in the demo stream
+            self._demo_state.events.appendleft(text)
 
     def _poll_state(self) -> None:
         """Poll agent state and push to active screen (every 250ms)."""
         try:
+            # Drain on every poll so the queue stays bounded on any screen
+            self._drain_events()
+
+            # Only the monitor consumes TUIState — skills reads the agent
+            # directly and game select needs nothing, so build lazily.
+            active = self.screen
+            if isinstance(active, SkillsScreen):
+                active.update_skills(self.agent)
+                if self._demo_mode or self.agent is None:
+                    self._demo_skipped += 1
+                return
+            if not isinstance(active, MonitorScreen):
+                return
+
             if self._demo_mode or self.agent is None:
-                # Stable demo: incremental mutations, no flickering
-                state = self._demo_sim.tick()
-                # Merge any real events (e.g., "system: Agent starting...")
-                real_events = self._get_events()
-                if real_events:
-                    state.events = real_events + state.events[:20]
+                # Stable demo: incremental mutations, no flickering.
+                # Catch up on polls missed offscreen in one batched step.
+                if self._demo_skipped:
+                    self._demo_sim.fast_forward(self._demo_state, self._demo_skipped)
+                    self._demo_skipped = 0
+                self._demo_sim.tick(self._demo_state)
+                state = self._demo_state
             else:
-                state = TUIState.from_agent(self.agent)
-                state.events = self._get_events()
+                state = self._live_state
+                state.update_from_agent(self.agent)
                 state.uptime_seconds = int(time.time() - self._start_time)
 
-            # Push to active screen
-            active = self.screen
-            if isinstance(active, MonitorScreen):
-                active.update_state(state)
-            elif isinstance(active, SkillsScreen):
-                active.update_skills(self.agent)
+            active.update_state(state)
 
         except Exception:
             pass  # Polling must never crash
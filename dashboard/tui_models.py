@@ -8,15 +8,48 @@ Provides a simplified, flat snapshot for UI consumption.
 from __future__ import annotations
 
 import random
+import sys
 import time
+from bisect import bisect
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import ClassVar, Optional, TYPE_CHECKING
+
+import numpy as np
+from rich.text import Text
 
 if TYPE_CHECKING:
     from core.agent import NexusAgent
 
+# C-level key for max() over dict.items() — no Python callback per item
+_by_value = itemgetter(1)
+
+# Shared read-only default for missing snapshot sections (no {} per miss)
+_EMPTY: MappingProxyType = MappingProxyType({})
+
+
+def _drift(hp: float, mana: float, d_hp: float, d_mana: float) -> tuple[float, float]:
+    """One tick of demo vital drift, clamped to HP [15, 100] / mana [10, 100]."""
+    hp = min(100.0, max(15.0, hp + d_hp))
+    mana = min(100.0, max(10.0, mana + d_mana))
+    return hp, mana
+
+
+@dataclass(slots=True)
+class BattleEntry:
+    """One battle-list row (slotted — mutated in place by the demo)."""
+
+    name: str
+    hp: float
+    dist: int
+    attacking: bool = False
 
-@dataclass
+
+@dataclass(slots=True)
 class TUIState:
     """Flat snapshot of all agent data for widget consumption."""
 
@@ -35,7 +68,7 @@ class TUIState:
 
     # Combat
     target: Optional[str] = None
-    battle_list: list[dict] = field(default_factory=list)
+    battle_list: list[BattleEntry] = field(default_factory=list)
     nearby_players: list[dict] = field(default_factory=list)
 
     # Session
@@ -58,19 +91,87 @@ class TUIState:
     goals: list[dict] = field(default_factory=list)
     memories: list[dict] = field(default_factory=list)
 
-    # Events (most recent first)
-    events: list[str] = field(default_factory=list)
+    # Events (most recent first, bounded)
+    events: deque[str] = field(default_factory=lambda: deque(maxlen=30))
 
     # Meta
     uptime_seconds: int = 0
 
+    # Derived display values, memoized on their source value. Not a
+    # cached_property: the same instance is mutated in place (demo) or
+    # refreshed in place (update_from_agent), so the cache must notice
+    # source changes.
+    _position_memo: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    _skill_memo: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    _uptime_memo: tuple = field(default=(None, ""), init=False, repr=False, compare=False)
+
+    @property
+    def position_text(self) -> Text:
+        """' Pos (x, y, z)' line for the vitals panel."""
+        pos, text = self._position_memo
+        if pos is not self.position:
+            x, y, z = pos = self.position
+            text = Text.assemble(" Pos ", (f"({x}, {y}, {z})", "cyan"))
+            self._position_memo = (pos, text)
+        return text
+
+    @property
+    def skill_text(self) -> Text:
+        """' Skill <name>' line for the vitals panel."""
+        skill, text = self._skill_memo
+        if skill != self.active_skill:
+            skill = self.active_skill
+            text = Text.assemble(" Skill ", (skill, "dim"))
+            self._skill_memo = (skill, text)
+        return text
+
+    @property
+    def uptime_str(self) -> str:
+        """Header uptime as '⏱ h:mm:ss' (falls back to session duration)."""
+        secs = self.uptime_seconds or int(self.duration_min * 60)
+        cached_secs, text = self._uptime_memo
+        if secs != cached_secs:
+            h, rem = divmod(secs, 3600)
+            m, sec = divmod(rem, 60)
+            text = f"⏱ {h}:{m:02d}:{sec:02d}"
+            self._uptime_memo = (secs, text)
+        return text
+
+    # update_from_agent() skips re-reading the agent while GameState.version
+    # is unchanged. Brain/consciousness/session-clock aren't versioned, so
+    # the TTL bounds how stale those can get while the game state sits still.
+    AGENT_CACHE_TTL: ClassVar[float] = 1.0
+    _agent_key: tuple = field(default=(None, -1, 0.0), init=False, repr=False, compare=False)
+
     @classmethod
     def from_agent(cls, agent: "NexusAgent") -> "TUIState":
-        """Build TUIState from a live NexusAgent instance."""
+        """Build a fresh TUIState from a live NexusAgent."""
+        state = cls()
+        state.update_from_agent(agent)
+        return state
+
+    def update_from_agent(self, agent: "NexusAgent") -> None:
+        """Refresh this state in place from a live NexusAgent.
+
+        The TUI keeps one long-lived instance and calls this every poll,
+        so no TUIState is allocated per tick. Unchanged values keep their
+        identity, which keeps the derived-text memos warm.
+        """
+        version = agent.state.version
+        now = time.monotonic()
+        agent_id, seen_version, built_at = self._agent_key
+        if (
+            agent_id == id(agent)
+            and seen_version == version
+            and now - built_at < self.AGENT_CACHE_TTL
+        ):
+            return
+        self._agent_key = (id(agent), version, now)
+
         snap = agent.state.get_snapshot()
-        char = snap.get("character", {})
-        combat = snap.get("combat", {})
-        session = snap.get("session", {})
+        char_get = snap.get("character", _EMPTY).get
+        combat_get = snap.get("combat", _EMPTY).get
+        session_get = snap.get("session", _EMPTY).get
 
         # ── Consciousness data (all defensive) ──
         emotion_label = ""
@@ -82,66 +183,90 @@ class TUIState:
             # emotion is a dict[str, float] — pick the dominant one
             raw_emotion = getattr(consciousness, "emotion", {})
             if isinstance(raw_emotion, dict) and raw_emotion:
-                top_key = max(raw_emotion, key=raw_emotion.get)
-                top_val = raw_emotion[top_key]
+                top_key, top_val = max(raw_emotion.items(), key=_by_value)
                 emotion_label = f"{top_key.capitalize()} ({top_val:.0%})" if top_val > 0.1 else ""
 
-            # goals have: description, category, priority, progress
+            # goals are consciousness.Goal: description, category, priority, progress.
+            # Typed dataclasses, so read fields directly — one guard per loop
+            # instead of a defaulted getattr per field.
             raw_goals = getattr(consciousness, "active_goals", [])
-            for g in raw_goals[:5]:
-                goals.append({
-                    "text": getattr(g, "description", "?")[:60],
-                    "type": getattr(g, "category", "?"),
-                    "priority": getattr(g, "priority", 0),
-                })
-
-            # memories have: category, content, importance
-            raw_memory = getattr(consciousness, "working_memory", None)
-            if raw_memory:
-                for m in list(raw_memory)[-5:]:
-                    memories.append({
-                        "type": getattr(m, "category", "?"),
-                        "text": getattr(m, "content", "?")[:80],
-                        "importance": getattr(m, "importance", 0),
+            try:
+                for g in islice(raw_goals, 5):
+                    goals.append({
+                        "text": g.description[:60],
+                        "type": g.category,
+                        "priority": g.priority,
                     })
+            except AttributeError:
+                pass  # Foreign goal object — keep what was built
 
-        pos = char.get("position", {})
+            # memories are consciousness.Memory: category, content, importance
+            raw_memory = getattr(consciousness, "working_memory", None)
+            if raw_memory:
+                try:
+                    # Newest 5 without copying the whole (up to 1000) deque
+                    recent = list(islice(reversed(raw_memory), 5))
+                    for m in reversed(recent):
+                        memories.append({
+                            "type": m.category,
+                            "text": m.content[:80],
+                            "importance": m.importance,
+                        })
+                except AttributeError:
+                    pass  # Foreign memory object — keep what was built
+
+        pos_get = char_get("position", _EMPTY).get
+        position = (pos_get("x", 0), pos_get("y", 0), pos_get("z", 0))
+        if position != self.position:
+            self.position = position
 
         # ── Strategic brain metrics (all defensive) ──
         brain = getattr(agent, "strategic_brain", None)
-        b_calls = brain.calls if brain else 0
-        b_latency = round(brain.avg_latency_ms) if brain else 0
-        b_error = round(brain.error_rate, 3) if brain else 0.0
-        b_skipped = brain.skipped_calls if brain else 0
-        b_cb = brain.circuit_breaker_state if brain else "CLOSED"
-
-        return cls(
-            hp=char.get("hp_percent", 100),
-            mana=char.get("mana_percent", 100),
-            position=(pos.get("x", 0), pos.get("y", 0), pos.get("z", 0)),
-            is_alive=char.get("is_alive", True),
-            mode=combat.get("mode", "IDLE"),
-            threat=combat.get("threat_level", "NONE"),
-            active_skill=snap.get("active_skill") or "None",
-            game=getattr(agent, "_game_id", "tibia"),
-            target=combat.get("current_target"),
-            battle_list=combat.get("battle_list", [])[:8],
-            nearby_players=combat.get("nearby_players", []),
-            xp_hr=round(session.get("xp_per_hour", 0)),
-            gold_hr=round(session.get("profit_per_hour", 0)),
-            kills=session.get("kills", 0),
-            deaths=session.get("deaths", 0),
-            duration_min=round(session.get("duration_minutes", 0), 1),
-            close_calls=session.get("close_calls", 0),
-            brain_calls=b_calls,
-            brain_latency_ms=b_latency,
-            brain_error_rate=b_error,
-            brain_skipped=b_skipped,
-            circuit_breaker=b_cb,
-            emotion=emotion_label,
-            goals=goals,
-            memories=memories,
-        )
+        if brain:
+            self.brain_calls = brain.calls
+            self.brain_latency_ms = round(brain.avg_latency_ms)
+            self.brain_error_rate = round(brain.error_rate, 3)
+            self.brain_skipped = brain.skipped_calls
+            self.circuit_breaker = brain.circuit_breaker_state
+        else:
+            self.brain_calls = 0
+            self.brain_latency_ms = 0
+            self.brain_error_rate = 0.0
+            self.brain_skipped = 0
+            self.circuit_breaker = "CLOSED"
+
+        self.hp = char_get("hp_percent", 100)
+        self.mana = char_get("mana_percent", 100)
+        self.is_alive = char_get("is_alive", True)
+        self.mode = combat_get("mode", "IDLE")
+        self.threat = combat_get("threat_level", "NONE")
+        self.active_skill = snap.get("active_skill") or "None"
+        self.game = getattr(agent, "_game_id", "tibia")
+        self.target = combat_get("current_target")
+        self.battle_list = [
+            BattleEntry(
+                c.get("name", "?"), c.get("hp", 0),
+                c.get("dist", 0), c.get("attacking", False),
+            )
+            for c in islice(combat_get("battle_list") or (), 8)
+        ]
+        self.nearby_players = combat_get("nearby_players", [])
+        self.xp_hr = round(session_get("xp_per_hour", 0))
+        self.gold_hr = round(session_get("profit_per_hour", 0))
+        self.kills = session_get("kills", 0)
+        self.deaths = session_get("deaths", 0)
+        self.duration_min = round(session_get("duration_minutes", 0), 1)
+        self.close_calls = session_get("close_calls", 0)
+        self.emotion = emotion_label
+        self.goals = goals
+        self.memories = memories
+
+
+def _interned(*names: str) -> tuple[str, ...]:
+    """Intern demo vocabulary so equality/hash checks downstream
+    (MODE_COLORS lookups, handler dispatch) hit the identity fast path —
+    literals like "Dragon Lord" aren't auto-interned by the compiler."""
+    return tuple(sys.intern(n) for n in names)
 
 
 class DemoSimulator:
@@ -151,135 +276,276 @@ class DemoSimulator:
     Instead of fully random data every 250ms (which causes wild flickering),
     this maintains a persistent state that evolves slowly — kills go up,
     HP fluctuates, new events appear every few seconds.
-    """
 
-    CREATURES = ["Rat", "Cyclops", "Dragon Lord", "Demon", "Hydra", "Orc Berserker", "Giant Spider"]
-    MODES = ["HUNTING", "LOOTING", "NAVIGATING", "EXPLORING"]
-    EMOTIONS = ["Focused", "Confident", "Cautious", "Excited", "Alert"]
+    The simulator owns no TUIState: the caller keeps one long-lived
+    instance (seeded via initial_state()) and tick() mutates it in place.
+    """
 
-    def __init__(self):
-        self._state = self._initial_state()
+    CREATURES = _interned("Rat", "Cyclops", "Dragon Lord", "Demon", "Hydra", "Orc Berserker", "Giant Spider")
+    MODES = _interned("HUNTING", "LOOTING", "NAVIGATING", "EXPLORING")
+    EMOTIONS = _interned("Focused", "Confident", "Cautious", "Excited", "Alert")
+
+    # Event-type sampling: weights 3/3/2/1/1, stored cumulatively
+    _EVENT_TYPES = _interned("kill", "loot", "heal", "spot", "move")
+    _EVENT_CUM_WEIGHTS = (3, 6, 8, 9, 10)
+    _EVENT_TOTAL_WEIGHT = 10
+
+    # Seed data for initial_state(), frozen once at class creation
+    _SEED_SCALARS = MappingProxyType({
+        "hp": 78.5,
+        "mana": 62.3,
+        "position": (132, 187, 7),
+        "mode": "HUNTING",
+        "threat": "NONE",
+        "active_skill": "rotworm_hunt_v3",
+        "target": "Cyclops",
+        "xp_hr": 145000,
+        "gold_hr": 22000,
+        "kills": 47,
+        "deaths": 0,
+        "duration_min": 35.2,
+        "close_calls": 2,
+        "brain_calls": 142,
+        "brain_latency_ms": 280,
+        "brain_error_rate": 0.012,
+        "brain_skipped": 3,
+        "circuit_breaker": "CLOSED",
+        "emotion": "Focused (85%)",
+        "uptime_seconds": 2112,
+    })
+    _SEED_BATTLE = (
+        ("Cyclops", 65, 3, True),   # BattleEntry(name, hp, dist, attacking)
+        ("Rat", 100, 6, False),
+    )
+    _SEED_GOALS = (
+        MappingProxyType({"text": "Hunt efficiently in Cyclopolis", "type": "primary", "priority": 1}),
+        MappingProxyType({"text": "Avoid PK zones near cave exit", "type": "safety", "priority": 2}),
+    )
+    _SEED_MEMORIES = (
+        MappingProxyType({"type": "discovery", "text": "Good spawn density at NE corner", "importance": 0.8}),
+        MappingProxyType({"type": "combat", "text": "Close call with 3 cyclops at once", "importance": 0.9}),
+    )
+    _SEED_EVENTS = (
+        "kill: Cyclops",
+        "loot: 230 gold",
+        "heal: exura (145 hp)",
+        "spot: Rat x2",
+    )
+
+    # Periodic step cadence, in ticks (~3s / ~20s at 4 Hz)
+    EVENT_EVERY = 12
+    MODE_EVERY = 80
+
+    # fast_forward() replays at most this many of the newest step boundaries;
+    # older ones would scroll straight out of the bounded event stream
+    MAX_REPLAY_STEPS = 50
+
+    # Per-tick noise rows pre-sampled per refill: (d_hp, d_mana, close_call_roll)
+    NOISE_BATCH = 1024
+
+    def __init__(self, seed: Optional[int] = None):
         self._tick: int = 0
         self._last_event_tick: int = 0
         self._last_mode_tick: int = 0
-
-    def _initial_state(self) -> TUIState:
+        self._next_uptime_min: float = 0.0  # duration_min at which uptime ticks over
+
+        # Private RNGs: isolated from the global `random` state (tests, other
+        # callers) and reproducible when seeded — same seed, same demo run.
+        self._r = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+        self._noise: list[list[float]] = []
+        self._noise_idx: int = 0
+        self._refill_noise()
+
+        # event type → handler(state, creature) that mutates state, returns the line
+        self._event_handlers = {
+            "kill": self._on_kill,
+            "loot": self._on_loot,
+            "heal": self._on_heal,
+            "spot": self._on_spot,
+            "move": self._on_move,
+        }
+
+    def _refill_noise(self) -> None:
+        """Draw the next NOISE_BATCH ticks of every-tick randomness in one call."""
+        noise = self._rng.random((self.NOISE_BATCH, 3))
+        noise[:, 0] = noise[:, 0] * 5.0 - 2.0   # HP drift    ~ U(-2, 3)
+        noise[:, 1] = noise[:, 1] * 3.5 - 1.5   # Mana drift  ~ U(-1.5, 2)
+        self._noise = noise.tolist()             # column 2: U(0, 1) roll
+        self._noise_idx = 0
+
+    # ── Event handlers (see _event_handlers) ──
+
+    def _on_kill(self, s: TUIState, creature: str) -> str:
+        s.kills += 1
+        s.xp_hr = min(350000, s.xp_hr + self._r.randint(500, 2000))
+        return f"kill: {creature}"
+
+    def _on_loot(self, s: TUIState, creature: str) -> str:
+        randint = self._r.randint
+        gold = randint(20, 400)
+        s.gold_hr = min(80000, s.gold_hr + randint(100, 500))
+        return f"loot: {gold} gold"
+
+    def _on_heal(self, s: TUIState, creature: str) -> str:
+        hp_healed = self._r.randint(50, 200)
+        s.hp = min(100.0, s.hp + hp_healed * 0.1)
+        return f"heal: exura ({hp_healed} hp)"
+
+    def _on_spot(self, s: TUIState, creature: str) -> str:
+        return f"spot: {creature} x{self._r.randint(1, 3)}"
+
+    def _on_move(self, s: TUIState, creature: str) -> str:
+        randint = self._r.randint
+        dx, dy = randint(-3, 3), randint(-3, 3)
+        x, y, z = s.position
+        if dx or dy or z != 7:
+            # Keep the tuple identity stable when the step is a no-op
+            x, y = x + dx, y + dy
+            s.position = (x, y, 7)
+        return f"move: ({x}, {y}, 7)"
+
+    def initial_state(self) -> TUIState:
+        """Seed state for the simulation — pass it to every tick()."""
         return TUIState(
-            hp=78.5,
-            mana=62.3,
-            position=(132, 187, 7),
-            mode="HUNTING",
-            threat="NONE",
-            active_skill="rotworm_hunt_v3",
-            target="Cyclops",
-            battle_list=[
-                {"name": "Cyclops", "hp": 65, "dist": 3, "attacking": True},
-                {"name": "Rat", "hp": 100, "dist": 6, "attacking": False},
-            ],
-            xp_hr=145000,
-            gold_hr=22000,
-            kills=47,
-            deaths=0,
-            duration_min=35.2,
-            close_calls=2,
-            brain_calls=142,
-            brain_latency_ms=280,
-            brain_error_rate=0.012,
-            brain_skipped=3,
-            circuit_breaker="CLOSED",
-            emotion="Focused (85%)",
-            goals=[
-                {"text": "Hunt efficiently in Cyclopolis", "type": "primary", "priority": 1},
-                {"text": "Avoid PK zones near cave exit", "type": "safety", "priority": 2},
-            ],
-            memories=[
-                {"type": "discovery", "text": "Good spawn density at NE corner", "importance": 0.8},
-                {"type": "combat", "text": "Close call with 3 cyclops at once", "importance": 0.9},
-            ],
-            events=[
-                "kill: Cyclops",
-                "loot: 230 gold",
-                "heal: exura (145 hp)",
-                "spot: Rat x2",
-            ],
-            uptime_seconds=2112,
+            **self._SEED_SCALARS,
+            # tick() mutates creature HP in place — the only entries copied
+            battle_list=[BattleEntry(*c) for c in self._SEED_BATTLE],
+            # Read-only downstream: share the frozen mappings
+            goals=list(self._SEED_GOALS),
+            memories=list(self._SEED_MEMORIES),
+            events=deque(self._SEED_EVENTS, maxlen=30),
         )
 
-    def tick(self) -> TUIState:
-        """Advance simulation by one step (~250ms). Returns stable, evolving state."""
-        s = self._state
+    def tick(self, state: TUIState) -> None:
+        """Advance simulation by one step (~250ms), mutating ``state`` in place."""
+        s = state
         self._tick += 1
 
+        if self._noise_idx >= self.NOISE_BATCH:
+            self._refill_noise()
+        d_hp, d_mana, close_roll = self._noise[self._noise_idx]
+        self._noise_idx += 1
+
         # ── Every tick: subtle vital fluctuations ──
-        s.hp = max(15, min(100, s.hp + random.uniform(-2, 3)))
-        s.mana = max(10, min(100, s.mana + random.uniform(-1.5, 2)))
+        s.hp, s.mana = _drift(s.hp, s.mana, d_hp, d_mana)
         s.duration_min += 0.004  # ~1s per 4 ticks
-        s.uptime_seconds = int(s.duration_min * 60)
+        if s.duration_min >= self._next_uptime_min:
+            # Whole-second boundary crossed (~1 in 4 ticks) — only then re-derive
+            s.uptime_seconds = int(s.duration_min * 60)
+            self._next_uptime_min = (s.uptime_seconds + 1) / 60
 
         # ── Every ~3s (12 ticks): add an event, increment stats ──
-        if self._tick - self._last_event_tick >= 12:
+        if self._tick - self._last_event_tick >= self.EVENT_EVERY:
             self._last_event_tick = self._tick
-            creature = random.choice(self.CREATURES)
-
-            event_type = random.choices(
-                ["kill", "loot", "heal", "spot", "move"],
-                weights=[3, 3, 2, 1, 1],
-                k=1,
-            )[0]
-
-            if event_type == "kill":
-                s.kills += 1
-                s.xp_hr = min(350000, s.xp_hr + random.randint(500, 2000))
-                evt = f"kill: {creature}"
-            elif event_type == "loot":
-                gold = random.randint(20, 400)
-                s.gold_hr = min(80000, s.gold_hr + random.randint(100, 500))
-                evt = f"loot: {gold} gold"
-            elif event_type == "heal":
-                hp_healed = random.randint(50, 200)
-                s.hp = min(100, s.hp + hp_healed * 0.1)
-                evt = f"heal: exura ({hp_healed} hp)"
-            elif event_type == "spot":
-                evt = f"spot: {creature} x{random.randint(1, 3)}"
-            else:
-                x, y = s.position[0] + random.randint(-3, 3), s.position[1] + random.randint(-3, 3)
-                s.position = (x, y, 7)
-                evt = f"move: ({x}, {y}, 7)"
-
-            s.events.insert(0, evt)
-            if len(s.events) > 30:
-                s.events = s.events[:30]
-
-            # Battle list: occasionally add/remove creatures
-            if random.random() > 0.7:
-                if len(s.battle_list) < 6:
-                    s.battle_list.append({
-                        "name": random.choice(self.CREATURES),
-                        "hp": random.uniform(30, 100),
-                        "dist": random.randint(1, 8),
-                        "attacking": random.random() > 0.5,
-                    })
-                elif s.battle_list:
-                    s.battle_list.pop(random.randint(0, len(s.battle_list) - 1))
-
-            s.target = s.battle_list[0]["name"] if s.battle_list else None
-
-            # Mutate existing creature HP
-            for c in s.battle_list:
-                c["hp"] = max(0, min(100, c["hp"] + random.uniform(-15, 5)))
-
-            s.brain_calls += 1
+            self._event_step(s)
 
         # ── Every ~20s (80 ticks): mode change ──
-        if self._tick - self._last_mode_tick >= 80:
+        if self._tick - self._last_mode_tick >= self.MODE_EVERY:
             self._last_mode_tick = self._tick
-            s.mode = random.choice(self.MODES)
-            s.emotion = f"{random.choice(self.EMOTIONS)} ({random.randint(60, 95)}%)"
-            s.events.insert(0, f"mode: {s.mode}")
+            self._mode_step(s)
 
         # ── Close call: rare event ──
-        if s.hp < 25 and random.random() > 0.9:
+        if s.hp < 25 and close_roll > 0.9:
             s.close_calls += 1
-            s.events.insert(0, f"CLOSE CALL: HP {s.hp:.0f}%")
+            s.events.appendleft(f"CLOSE CALL: HP {s.hp:.0f}%")
+
+    def fast_forward(self, state: TUIState, n: int) -> None:
+        """Advance ``n`` ticks at once (e.g. frames skipped while offscreen).
+
+        Vital drift is drawn and accumulated in one vectorized pass; only
+        the final HP/mana land on ``state``. Event and mode steps fire in
+        tick order at the 12/80-tick boundaries crossed, but only the newest
+        MAX_REPLAY_STEPS of them — stat bumps from older steps are not
+        accrued. The clamp is applied once to the summed drift rather than
+        every tick, so a walk that hits a bound mid-way lands a little
+        differently than n tick() calls would.
+        """
+        if n <= 0:
+            return
+        s = state
+        start = self._tick
+        self._tick = end = start + n
+
+        drift = self._rng.random((n, 2))
+        drift[:, 0] = drift[:, 0] * 5.0 - 2.0   # HP drift    ~ U(-2, 3)
+        drift[:, 1] = drift[:, 1] * 3.5 - 1.5   # Mana drift  ~ U(-1.5, 2)
+        d_hp, d_mana = drift.sum(axis=0)
+        s.hp = float(np.clip(s.hp + d_hp, 15.0, 100.0))
+        s.mana = float(np.clip(s.mana + d_mana, 10.0, 100.0))
+
+        s.duration_min += 0.004 * n
+        s.uptime_seconds = int(s.duration_min * 60)
+        self._next_uptime_min = (s.uptime_seconds + 1) / 60
+
+        event_ticks = range(self._last_event_tick + self.EVENT_EVERY, end + 1, self.EVENT_EVERY)
+        mode_ticks = range(self._last_mode_tick + self.MODE_EVERY, end + 1, self.MODE_EVERY)
+        if event_ticks:
+            self._last_event_tick = event_ticks[-1]
+        if mode_ticks:
+            self._last_mode_tick = mode_ticks[-1]
+
+        # Merge both cadences by tick; on a shared tick the event step goes
+        # first, as in tick()
+        keep = self.MAX_REPLAY_STEPS
+        steps = list(merge(
+            ((t, 0) for t in event_ticks[-keep:]),
+            ((t, 1) for t in mode_ticks[-keep:]),
+        ))
+        for _, is_mode in steps[-keep:]:
+            if is_mode:
+                self._mode_step(s)
+            else:
+                self._event_step(s)
 
-        return s
+        if s.hp < 25 and self._r.random() > 0.9:
+            s.close_calls += 1
+            s.events.appendleft(f"CLOSE CALL: HP {s.hp:.0f}%")
+
+    def _event_step(self, s: TUIState) -> None:
+        """Periodic event: one event line, battle-list churn, stat bumps."""
+        # Bind RNG methods once for this step's dozen-odd draws
+        r = self._r
+        uniform = r.uniform
+        randint = r.randint
+        choice = r.choice
+        rand = r.random
+        creatures = self.CREATURES
+
+        creature = choice(creatures)
+
+        # Same draw random.choices(weights=...) makes, minus the per-call
+        # accumulate(): one bisect into the precomputed cumulative weights
+        event_type = self._EVENT_TYPES[
+            bisect(self._EVENT_CUM_WEIGHTS, rand() * self._EVENT_TOTAL_WEIGHT)
+        ]
+
+        s.events.appendleft(self._event_handlers[event_type](s, creature))
+
+        # Battle list: occasionally add/remove creatures
+        battle = s.battle_list
+        if rand() > 0.7:
+            if len(battle) < 6:
+                battle.append(BattleEntry(
+                    name=choice(creatures),
+                    hp=uniform(30, 100),
+                    dist=randint(1, 8),
+                    attacking=rand() > 0.5,
+                ))
+            elif battle:
+                battle.pop(randint(0, len(battle) - 1))
+
+        s.target = battle[0].name if battle else None
+
+        # Mutate existing creature HP
+        for c in battle:
+            c.hp = max(0, min(100, c.hp + uniform(-15, 5)))
+
+        s.brain_calls += 1
+
+    def _mode_step(self, s: TUIState) -> None:
+        """Periodic mode/emotion change."""
+        r = self._r
+        s.mode = r.choice(self.MODES)
+        s.emotion = f"{r.choice(self.EMOTIONS)} ({r.randint(60, 95)}%)"
+        s.events.appendleft(f"mode: {s.mode}")
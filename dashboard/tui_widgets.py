@@ -7,21 +7,45 @@ Each widget is self-contained and updates via refresh(state).
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import islice
+from typing import NamedTuple
+
+import numpy as np
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Static
 from rich.text import Text
 
-from dashboard.tui_models import TUIState
+from dashboard.tui_models import BattleEntry, TUIState
 
 
 # ═══════════════════════════════════════════════════════
 #  Vital Bars (HP / Mana)
 # ═══════════════════════════════════════════════════════
 
+# Every possible bar string, indexed by filled cells (0..20 / 0..10)
+_VITAL_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+_BATTLE_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+# Creature HP color bands: (…, 30] red, (30, 60] yellow, (60, …) green
+_HP_THRESHOLDS = np.array([30.0, 60.0])
+_HP_PALETTE = ("red", "yellow", "green")
+
+
+@lru_cache(maxsize=128)
+def _build_vital_text(color: str, label: str, filled: int) -> Text:
+    """Static part of a vital bar line (label + colored bar), parsed once."""
+    return Text.assemble(f" {label} ", (_VITAL_BARS[filled], color), " ")
+
+
 class VitalBar(Static):
     """Animated HP or Mana bar with gradient coloring."""
 
+    __slots__ = ("_style_type",)
+
     value: reactive[float] = reactive(100.0)
     label_text: reactive[str] = reactive("HP")
 
@@ -47,12 +71,10 @@ class VitalBar(Static):
     def render(self) -> Text:
         pct = max(0.0, min(100.0, self.value))
         color = self._get_color(pct)
-        filled = int(pct / 5)
-        empty = 20 - filled
-        bar = f"{'█' * filled}{'░' * empty}"
-        return Text.from_markup(
-            f" {self.label_text} [{color}]{bar}[/{color}] {pct:5.1f}%"
-        )
+        # Cached skeleton is shared — copy before appending the percentage
+        text = _build_vital_text(color, self.label_text, int(pct / 5)).copy()
+        text.append(f"{pct:5.1f}%")
+        return text
 
     def update_value(self, val: float):
         self.value = val
@@ -86,26 +108,47 @@ THREAT_COLORS = {
 }
 
 
+THREAT_ICONS = {"NONE": "◇", "LOW": "◆", "MEDIUM": "▲", "HIGH": "▲▲", "CRITICAL": "⚠ ▲▲▲"}
+
+
+@lru_cache(maxsize=128)
+def _build_mode_text(mode: str) -> Text:
+    color = MODE_COLORS.get(mode, "white")
+    return Text.assemble(" Mode  ", (f"● {mode}", color))
+
+
+@lru_cache(maxsize=128)
+def _build_threat_text(threat: str) -> Text:
+    color = THREAT_COLORS.get(threat, "white")
+    icon = THREAT_ICONS.get(threat, "?")
+    return Text.assemble(" Threat ", (f"{icon} {threat}", color))
+
+
+# Every known mode/threat badge, built once at import
+_MODE_TEXTS = {mode: _build_mode_text(mode) for mode in MODE_COLORS}
+_THREAT_TEXTS = {threat: _build_threat_text(threat) for threat in THREAT_COLORS}
+
+
 class ModeIndicator(Static):
     """Shows current agent mode with colored badge."""
 
+    __slots__ = ()
+
     mode: reactive[str] = reactive("IDLE")
 
     def render(self) -> Text:
-        color = MODE_COLORS.get(self.mode, "white")
-        return Text.from_markup(f" Mode  [{color}]● {self.mode}[/{color}]")
+        return _MODE_TEXTS.get(self.mode) or _build_mode_text(self.mode)
 
 
 class ThreatIndicator(Static):
     """Shows current threat level."""
 
+    __slots__ = ()
+
     threat: reactive[str] = reactive("NONE")
 
     def render(self) -> Text:
-        color = THREAT_COLORS.get(self.threat, "white")
-        icons = {"NONE": "◇", "LOW": "◆", "MEDIUM": "▲", "HIGH": "▲▲", "CRITICAL": "⚠ ▲▲▲"}
-        icon = icons.get(self.threat, "?")
-        return Text.from_markup(f" Threat [{color}]{icon} {self.threat}[/{color}]")
+        return _THREAT_TEXTS.get(self.threat) or _build_threat_text(self.threat)
 
 
 # ═══════════════════════════════════════════════════════
@@ -115,6 +158,8 @@ class ThreatIndicator(Static):
 class BattleListWidget(Static):
     """Shows creatures on screen with inline HP bars."""
 
+    __slots__ = ("_last_key", "_prefixes", "_bars", "_hp_colors", "_suffixes")
+
     DEFAULT_CSS = """
     BattleListWidget {
         height: auto;
@@ -124,51 +169,76 @@ class BattleListWidget(Static):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._battle_list: list[dict] = []
-        self._target: str | None = None
-
-    def update_data(self, battle_list: list[dict], target: str | None = None):
-        self._battle_list = battle_list
-        self._target = target
+        self._last_key: tuple | None = None
+        # Render-ready columns (one entry per shown creature), built in update_data:
+        # " ► Name            " | bar | hp color | "   65% d:3 ⚔"
+        self._prefixes: list[str] = []
+        self._bars: list[str] = []
+        self._hp_colors: list[str] = []
+        self._suffixes: list[str] = []
+
+    def update_data(self, battle_list: list[BattleEntry], target: str | None = None):
+        # Entries are mutated in place upstream — compare by value, not identity
+        rows = [(c.name, c.hp, c.dist, c.attacking) for c in islice(battle_list, 8)]
+        key = (target, rows)
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        # Clamp, band and bucket every HP in one vectorized pass
+        hps = np.clip(np.fromiter((r[1] for r in rows), float, len(rows)), 0.0, 100.0)
+        self._hp_colors = [_HP_PALETTE[i] for i in np.searchsorted(_HP_THRESHOLDS, hps).tolist()]
+        self._bars = [_BATTLE_BARS[i] for i in (hps / 10).astype(np.intp).tolist()]
+
+        prefixes, suffixes = [], []
+        for (name, _, dist, atk), hp in zip(rows, hps.tolist()):
+            name = name[:16]
+            marker = " ► " if name == target else "   "
+            prefixes.append(marker + name.ljust(16) + " ")
+            # round() matches the old "{hp:4.0f}" (both round half to even)
+            suffixes.append(" " + str(round(hp)).rjust(4) + "% d:" + str(dist) + (" ⚔" if atk else ""))
+        self._prefixes, self._suffixes = prefixes, suffixes
         self.refresh()
 
     def render(self) -> Text:
-        if not self._battle_list:
-            return Text.from_markup(" [dim]No creatures[/dim]")
-
-        lines = []
-        for c in self._battle_list[:8]:
-            name = c.get("name", "?")[:16]
-            hp = max(0.0, min(100.0, c.get("hp", 0)))
-            dist = c.get("dist", 0)
-            attacking = c.get("attacking", False)
+        if not self._prefixes:
+            return Text.assemble(" ", ("No creatures", "dim"))
 
-            if hp > 60:
-                hp_color = "green"
-            elif hp > 30:
-                hp_color = "yellow"
-            else:
-                hp_color = "red"
+        segments: list = []
+        for prefix, bar, hp_color, suffix in zip(
+            self._prefixes, self._bars, self._hp_colors, self._suffixes,
+        ):
+            segments += (prefix, (bar, hp_color), suffix, "\n")
 
-            marker = "►" if name == self._target else " "
-            atk = " ⚔" if attacking else ""
-            filled = int(hp / 10)
-            bar = "█" * filled + "░" * (10 - filled)
-
-            lines.append(
-                f" {marker} {name:<16} [{hp_color}]{bar}[/{hp_color}] {hp:4.0f}% d:{dist}{atk}"
-            )
-
-        return Text.from_markup("\n".join(lines))
+        return Text.assemble(*segments[:-1])
 
 
 # ═══════════════════════════════════════════════════════
 #  Event Stream
 # ═══════════════════════════════════════════════════════
 
+# Event line style by its "prefix:" (anything else renders dim). Every
+# producer (_format_event, the demo) writes "prefix: payload", so the key
+# is one str.partition — cheaper per line than a compiled-regex match.
+_EVENT_PREFIX_STYLE = {
+    "kill": "green",
+    "death": "red bold",
+    "CLOSE CALL": "red bold",
+    "heal": "cyan",
+    "loot": "yellow",
+    "spot": "magenta",
+    "player": "magenta",
+    "mode": "blue",
+    "brain": "dark_orange",
+    "error": "red",
+}
+
+
 class EventStream(Static):
     """Log of recent agent events (newest first)."""
 
+    __slots__ = ("_events", "_shown")
+
     DEFAULT_CSS = """
     EventStream {
         height: 100%;
@@ -177,99 +247,105 @@ class EventStream(Static):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._events: list[str] = []
+        self._events: deque[str] = deque(maxlen=50)
+        self._shown: tuple[str, ...] = ()
 
     def push_event(self, event: str):
-        self._events.insert(0, event)
-        if len(self._events) > 50:
-            self._events = self._events[:50]
+        self._events.appendleft(event)  # maxlen drops the oldest
         self.refresh()
 
-    def set_events(self, events: list[str]):
-        self._events = events[:50]
+    def set_events(self, events: Iterable[str]):
+        events = deque(islice(events, 50), maxlen=50)
+        shown = tuple(islice(events, 15))  # What render() would draw
+        self._events = events
+        if shown == self._shown:
+            return
+        self._shown = shown
         self.refresh()
 
     def render(self) -> Text:
         if not self._events:
-            return Text.from_markup(" [dim]Waiting for events...[/dim]")
-
-        lines = []
-        for ev in self._events[:15]:
-            if ev.startswith("kill:"):
-                lines.append(f" [green]{ev}[/green]")
-            elif ev.startswith("death:") or ev.startswith("CLOSE CALL"):
-                lines.append(f" [red bold]{ev}[/red bold]")
-            elif ev.startswith("heal:"):
-                lines.append(f" [cyan]{ev}[/cyan]")
-            elif ev.startswith("loot:"):
-                lines.append(f" [yellow]{ev}[/yellow]")
-            elif ev.startswith("spot:") or ev.startswith("player:"):
-                lines.append(f" [magenta]{ev}[/magenta]")
-            elif ev.startswith("mode:"):
-                lines.append(f" [blue]{ev}[/blue]")
-            elif ev.startswith("brain:"):
-                lines.append(f" [dark_orange]{ev}[/dark_orange]")
-            elif ev.startswith("error:"):
-                lines.append(f" [red]{ev}[/red]")
-            else:
-                lines.append(f" [dim]{ev}[/dim]")
-
-        return Text.from_markup("\n".join(lines))
+            return Text.assemble(" ", ("Waiting for events...", "dim"))
+
+        # Append straight into the Text — no per-render line/segment list
+        text = Text()
+        append = text.append
+        sep = " "
+        for ev in islice(self._events, 15):
+            append(sep)
+            append(ev, _EVENT_PREFIX_STYLE.get(ev.partition(":")[0], "dim"))
+            sep = "\n "
+        return text
 
 
 # ═══════════════════════════════════════════════════════
 #  Session Stats
 # ═══════════════════════════════════════════════════════
 
+@lru_cache(maxsize=1024)
+def _format_number(n: int) -> str:
+    """Compact rate display (1.2M / 145.0k / 950), memoized on the raw value."""
+    if n >= 1_000_000:
+        return f"{n / 1_000_000:.1f}M"
+    elif n >= 1_000:
+        return f"{n / 1_000:.1f}k"
+    return str(n)
+
+
+_SESSION_TEMPLATE = (
+    " [bold]Session[/bold] {hours}h{mins:02d}m\n"
+    " XP/hr   [cyan]{xp}[/cyan]\n"
+    " Gold/hr [yellow]{gold}[/yellow]\n"
+    " Kills   [green]{kills}[/green]\n"
+    " Deaths  [red]{deaths}[/red]\n"
+    " Close   [dark_orange]{cc}[/dark_orange]"
+)
+
+
+class _SessionSnap(NamedTuple):
+    """What SessionStats draws — doubles as its change-detection key."""
+
+    xp_hr: int
+    gold_hr: int
+    kills: int
+    deaths: int
+    minutes: int  # Duration only renders to the minute
+    close_calls: int
+
+
 class SessionStats(Static):
     """XP/hr, Gold/hr, Kills, Deaths grid."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._data: dict = {}
+        self._data: _SessionSnap | None = None
 
     def update_stats(self, state: TUIState):
-        self._data = {
-            "xp_hr": state.xp_hr,
-            "gold_hr": state.gold_hr,
-            "kills": state.kills,
-            "deaths": state.deaths,
-            "duration": state.duration_min,
-            "close_calls": state.close_calls,
-        }
+        snap = _SessionSnap(
+            state.xp_hr, state.gold_hr, state.kills, state.deaths,
+            int(state.duration_min), state.close_calls,
+        )
+        if snap == self._data:
+            return
+        self._data = snap
         self.refresh()
 
-    @staticmethod
-    def _format_number(n: int) -> str:
-        if n >= 1_000_000:
-            return f"{n / 1_000_000:.1f}M"
-        elif n >= 1_000:
-            return f"{n / 1_000:.1f}k"
-        return str(n)
-
     def render(self) -> Text:
         d = self._data
-        if not d:
+        if d is None:
             return Text.from_markup(" [dim]No session data[/dim]")
 
-        xp = self._format_number(d.get("xp_hr", 0))
-        gold = self._format_number(d.get("gold_hr", 0))
-        kills = d.get("kills", 0)
-        deaths = d.get("deaths", 0)
-        dur = d.get("duration", 0)
-        cc = d.get("close_calls", 0)
-
-        hours = int(dur // 60)
-        mins = int(dur % 60)
-
-        return Text.from_markup(
-            f" [bold]Session[/bold] {hours}h{mins:02d}m\n"
-            f" XP/hr   [cyan]{xp}[/cyan]\n"
-            f" Gold/hr [yellow]{gold}[/yellow]\n"
-            f" Kills   [green]{kills}[/green]\n"
-            f" Deaths  [red]{deaths}[/red]\n"
-            f" Close   [dark_orange]{cc}[/dark_orange]"
-        )
+        return Text.from_markup(_SESSION_TEMPLATE.format_map({
+            "hours": d.minutes // 60,
+            "mins": d.minutes % 60,
+            "xp": _format_number(d.xp_hr),
+            "gold": _format_number(d.gold_hr),
+            "kills": d.kills,
+            "deaths": d.deaths,
+            "cc": d.close_calls,
+        }))
 
 
 # ═══════════════════════════════════════════════════════
@@ -281,44 +357,65 @@ CB_COLORS = {
     "HALF_OPEN": "yellow",
     "OPEN": "red bold",
 }
+_CB_TEXTS = {cb: Text(cb, style=color) for cb, color in CB_COLORS.items()}
+
+
+_BRAIN_TEMPLATE = (
+    " [bold]Strategic Brain[/bold]\n"
+    " Calls   {calls}\n"
+    " Latency [{lat_color}]{lat}ms[/{lat_color}]\n"
+    " Errors  {err:.1f}%\n"
+    " Skip    {skipped}\n"
+    " CB      "
+)
+
+
+class _BrainSnap(NamedTuple):
+    """What BrainStats draws — doubles as its change-detection key."""
+
+    calls: int
+    latency: int
+    error_rate: float
+    skipped: int
+    cb: str
 
 
 class BrainStats(Static):
     """Strategic brain metrics: calls, latency, errors, circuit breaker."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._data: dict = {}
+        self._data: _BrainSnap | None = None
 
     def update_stats(self, state: TUIState):
-        self._data = {
-            "calls": state.brain_calls,
-            "latency": state.brain_latency_ms,
-            "error_rate": state.brain_error_rate,
-            "skipped": state.brain_skipped,
-            "cb": state.circuit_breaker,
-        }
+        snap = _BrainSnap(
+            state.brain_calls, state.brain_latency_ms, state.brain_error_rate,
+            state.brain_skipped, state.circuit_breaker,
+        )
+        if snap == self._data:
+            return
+        self._data = snap
         self.refresh()
 
     def render(self) -> Text:
         d = self._data
-        if not d:
+        if d is None:
             return Text.from_markup(" [dim]No brain data[/dim]")
 
-        cb = d.get("cb", "CLOSED")
-        cb_color = CB_COLORS.get(cb, "white")
-        lat = d.get("latency", 0)
+        lat = d.latency
         lat_color = "green" if lat < 300 else ("yellow" if lat < 800 else "red")
-        err = d.get("error_rate", 0) * 100
-
-        return Text.from_markup(
-            f" [bold]Strategic Brain[/bold]\n"
-            f" Calls   {d.get('calls', 0)}\n"
-            f" Latency [{lat_color}]{lat}ms[/{lat_color}]\n"
-            f" Errors  {err:.1f}%\n"
-            f" Skip    {d.get('skipped', 0)}\n"
-            f" CB      [{cb_color}]{cb}[/{cb_color}]"
-        )
+
+        text = Text.from_markup(_BRAIN_TEMPLATE.format_map({
+            "calls": d.calls,
+            "lat": lat,
+            "lat_color": lat_color,
+            "err": d.error_rate * 100,
+            "skipped": d.skipped,
+        }))
+        text.append_text(_CB_TEXTS.get(d.cb) or Text(d.cb, style="white"))
+        return text
 
 
 # ═══════════════════════════════════════════════════════
@@ -337,41 +434,57 @@ EMOTION_ICONS = {
 class ConsciousnessPanel(Static):
     """Emotion, goals, recent memories."""
 
+    __slots__ = ("_emotion", "_emotion_icon", "_goals", "_memories", "_last_key", "_rendered")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._emotion: str = ""
+        self._emotion_icon: str = "🧠"
         self._goals: list[dict] = []
         self._memories: list[dict] = []
+        self._last_key: tuple | None = None
+        self._rendered: Text = self._build()
 
     def update_data(self, state: TUIState):
-        self._emotion = state.emotion
+        # Only the first 3 goals / 2 memories are drawn
+        key = (state.emotion, state.goals[:3], state.memories[:2])
+        if key == self._last_key:
+            return
+        self._last_key = key
+        if state.emotion != self._emotion:
+            self._emotion = state.emotion
+            # Icon by lowercase first word — "Focused (85%)" → "focused"
+            head = state.emotion.partition(" ")[0].lower().rstrip("(")
+            self._emotion_icon = EMOTION_ICONS.get(head, "🧠")
         self._goals = state.goals
         self._memories = state.memories
+        self._rendered = self._build()
         self.refresh()
 
     def render(self) -> Text:
-        lines = [" [bold]Consciousness[/bold]"]
+        return self._rendered
+
+    def _build(self) -> Text:
+        """Lay out the panel — only rerun when update_data() sees new data."""
+        segments: list = [" ", ("Consciousness", "bold")]
 
         if self._emotion:
-            # Try to find icon by lowercase first word
-            first_word = self._emotion.split()[0].lower().rstrip("(")
-            icon = EMOTION_ICONS.get(first_word, "🧠")
-            lines.append(f" {icon} [italic]{self._emotion}[/italic]")
+            segments += (f"\n {self._emotion_icon} ", (self._emotion, "italic"))
 
         if self._goals:
-            lines.append(" [dim]Goals:[/dim]")
+            segments += ("\n ", ("Goals:", "dim"))
             for g in self._goals[:3]:
-                lines.append(f"  • {g.get('text', '?')[:40]}")
+                segments.append(f"\n  • {g.get('text', '?')[:40]}")
 
         if self._memories:
-            lines.append(" [dim]Memory:[/dim]")
+            segments += ("\n ", ("Memory:", "dim"))
             for m in self._memories[:2]:
-                lines.append(f"  ◦ {m.get('text', '?')[:40]}")
+                segments.append(f"\n  ◦ {m.get('text', '?')[:40]}")
 
-        if len(lines) == 1:
-            lines.append(" [dim]No consciousness data[/dim]")
+        if len(segments) == 2:
+            segments += ("\n ", ("No consciousness data", "dim"))
 
-        return Text.from_markup("\n".join(lines))
+        return Text.assemble(*segments)
 
 
 # ═══════════════════════════════════════════════════════
@@ -381,6 +494,8 @@ class ConsciousnessPanel(Static):
 class GameCard(Static):
     """Selectable card for a game. Posts Selected message on click."""
 
+    __slots__ = ("game_id", "_name", "_genre", "_description", "_ready", "_rendered")
+
     class Selected(Message):
         """Posted when a ready game card is clicked."""
 
@@ -430,15 +545,18 @@ class GameCard(Static):
         else:
             self.add_class("-coming-soon")
 
-    def render(self) -> Text:
-        status = "[green]● READY[/green]" if self._ready else "[dim]○ COMING SOON[/dim]"
-        return Text.from_markup(
-            f"[bold]{self._name}[/bold]\n"
-            f"[dim]{self._genre}[/dim]\n\n"
-            f"{self._description[:60]}\n\n"
+        # Card content never changes after construction — parse it once
+        status = "[green]● READY[/green]" if ready else "[dim]○ COMING SOON[/dim]"
+        self._rendered = Text.from_markup(
+            f"[bold]{name}[/bold]\n"
+            f"[dim]{genre}[/dim]\n\n"
+            f"{description[:60]}\n\n"
             f"{status}"
         )
 
+    def render(self) -> Text:
+        return self._rendered
+
     def on_click(self) -> None:
         """Post Selected message when a ready game is clicked."""
         if self._ready:
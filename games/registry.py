@@ -20,10 +20,17 @@ log = structlog.get_logger()
 
 GAME_REGISTRY: dict[str, Type[GameAdapter]] = {}
 
+# Registry is static after startup — cache the game metadata (invalidated
+# by register_game()). Adapters themselves are never shared: each one owns
+# capture/perception tasks and input controllers once initialized.
+_INFO_CACHE: Optional[list[GameInfo]] = None
+
 
 def register_game(game_id: str, adapter_class: Type[GameAdapter]):
     """Register a game adapter in the global registry."""
+    global _INFO_CACHE
     GAME_REGISTRY[game_id] = adapter_class
+    _INFO_CACHE = None
     log.info("registry.game_registered", game=game_id, adapter=adapter_class.__name__)
 
 
@@ -39,14 +46,16 @@ def get_adapter(game_id: str) -> Optional[GameAdapter]:
 
 def list_games() -> list[GameInfo]:
     """List all registered games with their metadata."""
-    result = []
-    for game_id, cls in GAME_REGISTRY.items():
-        try:
-            adapter = cls()
-            result.append(adapter.get_info())
-        except Exception as e:
-            log.error("registry.info_error", game=game_id, error=str(e))
-    return result
+    global _INFO_CACHE
+    if _INFO_CACHE is None:
+        result = []
+        for game_id, cls in GAME_REGISTRY.items():
+            try:
+                result.append(cls().get_info())
+            except Exception as e:
+                log.error("registry.info_error", game=game_id, error=str(e))
+        _INFO_CACHE = result
+    return list(_INFO_CACHE)
 
 
 # ═══════════════════════════════════════════════════════
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import time
+import numpy as np
 import structlog
 from typing import Optional
 
@@ -32,6 +34,48 @@ from games.base import (
 
 log = structlog.get_logger()
 
+# Optional input backend, resolved once at import (not per send_input call)
+try:
+    from pynput.keyboard import Controller as KbController, Key
+    from pynput.mouse import Controller as MouseController, Button
+    _PYNPUT_OK = True
+except Exception:  # ImportError, or no display/backend on import
+    _PYNPUT_OK = False
+
+if sys.platform == "win32":
+    import ctypes
+    import threading
+
+    _USER32 = ctypes.windll.user32
+    # BOOL CALLBACK EnumWindowsProc(HWND hwnd, LPARAM lParam)
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+    _enum_hits = threading.local()  # Per-thread: lookups run via to_thread
+
+    def _enum_tibia_cb(hwnd, _lparam):
+        """Stop at the first visible window whose title contains "tibia"."""
+        if _USER32.IsWindowVisible(hwnd):
+            length = _USER32.GetWindowTextLengthW(hwnd)
+            if length > 0:
+                buf = ctypes.create_unicode_buffer(length + 1)
+                _USER32.GetWindowTextW(hwnd, buf, length + 1)
+                if "tibia" in buf.value.lower():
+                    _enum_hits.found = True
+                    return False  # Stops EnumWindows
+        return True
+
+    # One libffi thunk for the process lifetime, not one per lookup
+    _ENUM_TIBIA_CB = _WNDENUMPROC(_enum_tibia_cb)
+
+# Shared result for unknown actions — treat translate_action output as read-only
+_NO_ACTIONS: list[InputAction] = []
+
+
+def _put_latest(queue: asyncio.Queue, item) -> None:
+    """Enqueue without blocking — when full, drop the oldest entry."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
 
 class TibiaAdapter(GameAdapter):
     """
@@ -48,6 +92,38 @@ class TibiaAdapter(GameAdapter):
         self._config: dict = {}
         self._initialized = False
         self._window_found = False
+        self._window_checked_at: Optional[float] = None  # monotonic
+
+        # Perception pipeline: capture → frame_q → read → parsed_q → assemble.
+        # Bounded, drop-oldest queues so a slow stage sheds stale frames
+        # instead of building latency.
+        self._frame_q: Optional[asyncio.Queue] = None
+        self._parsed_q: Optional[asyncio.Queue] = None
+        self._pipeline_tasks: list[asyncio.Task] = []
+
+        # Recycled frame buffers: capture writes into _frames[_w] while older
+        # frames are still in flight downstream. Sized in initialize() to
+        # outnumber every frame the pipeline can hold at once. The slots are
+        # views into one (N, H, W, 3) block; the reader runs on threads in
+        # this process, so they are handed over by reference. Should the
+        # reader ever move to a separate process, back that block with
+        # multiprocessing.shared_memory and queue slot indices instead.
+        self._frames: list[Optional[np.ndarray]] = []
+        self._w = 0
+
+        # Input singletons — built once by _init_input(), reused per action
+        self._kb = None
+        self._mouse = None
+        self._input_failed = False
+        self._key_map: dict = {}
+        self._mod_map: dict = {}
+        # Exact InputAction spelling → resolved pynput key (memoized)
+        self._key_cache: dict = {}
+        self._mod_cache: dict = {}
+
+        # Static action → input templates, rebuilt when config changes
+        self._translations: dict[str, list[InputAction]] = {}
+        self._build_translations()
 
     def get_info(self) -> GameInfo:
         return GameInfo(
@@ -79,20 +155,71 @@ class TibiaAdapter(GameAdapter):
             recommended_resolution=(1920, 1080),
         )
 
+    def _init_input(self) -> bool:
+        """Create the pynput controllers and key tables once."""
+        if self._kb is not None:
+            return True
+        if self._input_failed:
+            return False
+        try:
+            if not _PYNPUT_OK:
+                raise ImportError("pynput not importable")
+            kb, mouse = KbController(), MouseController()
+        except Exception as e:  # ImportError, or no display/backend
+            self._input_failed = True  # Warn once, don't retry per action
+            log.warning("tibia_adapter.pynput_unavailable",
+                        reason="input disabled", error=str(e))
+            return False
+
+        self._kb = kb
+        self._mouse = mouse
+        self._key_map = {
+            "f1": Key.f1, "f2": Key.f2, "f3": Key.f3, "f4": Key.f4,
+            "f5": Key.f5, "f6": Key.f6, "f7": Key.f7, "f8": Key.f8,
+            "f9": Key.f9, "f10": Key.f10, "f11": Key.f11, "f12": Key.f12,
+            "enter": Key.enter, "esc": Key.esc, "space": Key.space,
+            "tab": Key.tab, "up": Key.up, "down": Key.down,
+            "left": Key.left, "right": Key.right,
+        }
+        self._mod_map = {"shift": Key.shift, "ctrl": Key.ctrl, "alt": Key.alt}
+        return True
+
     async def initialize(self, config: dict) -> bool:
         """Initialize Tibia-specific capture and input systems."""
         self._config = config
+        self._init_input()
+        self._build_translations()
 
         try:
             from perception.screen_capture import ScreenCapture
-            from perception.game_reader_v2 import GameReaderV2
+            from perception.game_reader_v2 import GameReaderV2, warm_kernels
             from core.state import GameState
 
+            # JIT-compile the numba kernels (if installed) off the event loop
+            # so the first frame doesn't stall on compilation
+            await asyncio.to_thread(warm_kernels)
+
+            perception_cfg = config.get("perception", {})
+            capture_cfg = perception_cfg.get("capture", {})
+            if sys.platform == "win32" and "backend" not in capture_cfg:
+                # dxcam = DXGI Desktop Duplication: frames come off the GPU
+                # without a GDI BitBlt/GetDIBits round trip
+                perception_cfg = {**perception_cfg, "capture": {**capture_cfg, "backend": "dxcam"}}
+
             state = GameState()
-            self.screen_capture = ScreenCapture(config.get("perception", {}))
-            self.game_reader = GameReaderV2(state, config.get("perception", {}))
+            self.screen_capture = ScreenCapture(perception_cfg)
+            self.game_reader = GameReaderV2(state, perception_cfg)
 
             await self.screen_capture.initialize()
+            self._frame_q = asyncio.Queue(maxsize=2)
+            self._parsed_q = asyncio.Queue(maxsize=2)
+            # + the frame being written, the one being read, the caller's
+            self._frames = [None] * (self._frame_q.maxsize + self._parsed_q.maxsize + 3)
+            self._w = 0
+            self._pipeline_tasks = [
+                asyncio.create_task(self._capture_loop(), name="tibia-capture"),
+                asyncio.create_task(self._perception_loop(), name="tibia-perception"),
+            ]
             self._initialized = True
 
             log.info("tibia_adapter.initialized")
@@ -102,77 +229,138 @@ class TibiaAdapter(GameAdapter):
             log.error("tibia_adapter.init_error", error=str(e))
             return False
 
+    async def on_stop(self):
+        """Stop the perception pipeline."""
+        for task in self._pipeline_tasks:
+            task.cancel()
+        await asyncio.gather(*self._pipeline_tasks, return_exceptions=True)
+        self._pipeline_tasks = []
+        self._initialized = False
+
+    async def _capture_loop(self):
+        """Pipeline stage 1: grab frames at the configured FPS.
+
+        Ticks are monotonic deadlines (loop.time()) advanced by a fixed
+        period, so sleep overshoot doesn't accumulate into drift. If a tick
+        runs late by a full period or more, the missed ticks are dropped
+        rather than captured back-to-back.
+        """
+        loop = asyncio.get_running_loop()
+        period = 1.0 / max(1, self.screen_capture.fps)
+        next_tick = loop.time()
+        while True:
+            try:
+                buf = self._frames[self._w]
+                frame = await self.screen_capture.capture_into(buf)
+                if frame is not None:
+                    if frame is not buf:
+                        # First frame or window resized — reallocate the ring
+                        # as one contiguous block at the new shape
+                        ring = np.empty((len(self._frames),) + frame.shape, frame.dtype)
+                        ring[0] = frame
+                        frame = ring[0]
+                        self._frames = list(ring)
+                        self._w = 0
+                    self._w = (self._w + 1) % len(self._frames)
+                    _put_latest(self._frame_q, frame)
+            except Exception as e:
+                log.error("tibia_adapter.capture_error", error=str(e))
+            next_tick += period
+            now = loop.time()
+            if now - next_tick >= period:
+                next_tick = now  # Fell behind — resync instead of bursting
+            await asyncio.sleep(max(0.0, next_tick - now))
+
+    async def _perception_loop(self):
+        """Pipeline stage 2: pixel analysis (runs in the reader's thread pool),
+        overlapping with the next capture."""
+        while True:
+            frame = await self._frame_q.get()
+            try:
+                # The game_reader updates the state object directly
+                await self.game_reader.process_frame(frame)
+                _put_latest(self._parsed_q, frame)
+            except Exception as e:
+                log.error("tibia_adapter.perception_error", error=str(e))
+
+    # capture_and_parse() gives up after this long without a parsed frame
+    PARSE_TIMEOUT = 1.0
+
     async def capture_and_parse(self) -> PerceptionResult:
-        """Capture Tibia screen and parse into standardized result."""
+        """Return the newest parsed frame as a standardized result.
+
+        Capture and pixel analysis run ahead in the pipeline tasks; this
+        only waits for the next parsed frame and assembles the result —
+        or returns an empty result if none arrives within PARSE_TIMEOUT.
+        ``result.frame`` is a recycled buffer — copy it to keep it.
+        """
         if not self._initialized or not self.screen_capture:
             return PerceptionResult()
 
         try:
-            frame = await self.screen_capture.capture()
-            if frame is None:
-                return PerceptionResult()
-
-            # The game_reader updates the state object directly
-            await self.game_reader.process_frame(frame)
-
+            frame = await asyncio.wait_for(self._parsed_q.get(), self.PARSE_TIMEOUT)
             state = self.game_reader.state
-            char = state.character
-
-            return PerceptionResult(
-                hp_percent=char.hp_percent if hasattr(char, "hp_percent") else 100,
-                mana_percent=char.mana_percent if hasattr(char, "mana_percent") else 100,
-                position=(state.position.x, state.position.y, state.position.z)
-                if state.position else None,
-                battle_list=[
-                    {
-                        "name": c.name,
-                        "hp": c.hp_percent,
-                        "distance": c.distance,
-                        "is_player": c.is_player,
-                    }
-                    for c in state.battle_list
-                ],
-                nearby_players=[
-                    {
+            pos = state.position  # Always set — GameState defaults to Position()
+
+            # One walk over the battle list builds both views. Plain append
+            # measured faster than [None] * n + index assignment for the
+            # ~10-entry lists seen here; entries stay dicts per the
+            # PerceptionResult contract (list[dict])
+            battle_list = []
+            nearby_players = []
+            for c in state.battle_list:
+                battle_list.append({
+                    "name": c.name,
+                    "hp": c.hp_percent,
+                    "distance": c.distance,
+                    "is_player": c.is_player,
+                })
+                if c.is_player:
+                    nearby_players.append({
                         "name": c.name,
                         "skull": c.skull,
-                    }
-                    for c in state.battle_list if c.is_player
-                ],
+                    })
+
+            return PerceptionResult(
+                hp_percent=state.hp_percent,
+                mana_percent=state.mana_percent,
+                position=(pos.x, pos.y, pos.z),
+                battle_list=battle_list,
+                nearby_players=nearby_players,
                 in_combat=state.mode.name in ("HUNTING", "FLEEING"),
                 frame=frame,
             )
 
+        except asyncio.TimeoutError:
+            # Nothing parsed lately (window gone, capture failing)
+            return PerceptionResult()
         except Exception as e:
             log.error("tibia_adapter.capture_error", error=str(e))
             return PerceptionResult()
 
     async def send_input(self, action: InputAction) -> bool:
         """Send input to Tibia window."""
-        try:
-            from pynput.keyboard import Controller as KbController, Key
-            from pynput.mouse import Controller as MouseController, Button
+        if not self._init_input():
+            return False
 
-            kb = KbController()
-            mouse = MouseController()
+        try:
+            kb = self._kb
+            mouse = self._mouse
 
             if action.action_type == "key_press":
-                # Map special keys
-                key_map = {
-                    "f1": Key.f1, "f2": Key.f2, "f3": Key.f3, "f4": Key.f4,
-                    "f5": Key.f5, "f6": Key.f6, "f7": Key.f7, "f8": Key.f8,
-                    "f9": Key.f9, "f10": Key.f10, "f11": Key.f11, "f12": Key.f12,
-                    "enter": Key.enter, "esc": Key.esc, "space": Key.space,
-                    "tab": Key.tab, "up": Key.up, "down": Key.down,
-                    "left": Key.left, "right": Key.right,
-                }
-                key = key_map.get(action.key.lower(), action.key)
+                # Map special keys — the hotkey set is small and fixed, so
+                # each spelling is lowercased and looked up only once
+                key = self._key_cache.get(action.key)
+                if key is None:
+                    key = self._key_map.get(action.key.lower(), action.key)
+                    self._key_cache[action.key] = key
 
                 # Handle modifiers
                 held = []
                 for mod in action.modifiers:
-                    mod_key = {"shift": Key.shift, "ctrl": Key.ctrl,
-                               "alt": Key.alt}.get(mod.lower())
+                    mod_key = self._mod_cache.get(mod, False)
+                    if mod_key is False:
+                        mod_key = self._mod_cache[mod] = self._mod_map.get(mod.lower())
                     if mod_key:
                         kb.press(mod_key)
                         held.append(mod_key)
@@ -186,9 +374,9 @@ class TibiaAdapter(GameAdapter):
                     kb.release(mod_key)
 
             elif action.action_type == "mouse_click":
+                # pynput's position setter is synchronous (SetCursorPos /
+                # XWarpPointer / CGWarp) — the cursor is there on return
                 mouse.position = (action.x, action.y)
-                await asyncio.sleep(0.02)
-
                 button = Button.right if "right" in action.key else Button.left
                 mouse.click(button)
 
@@ -204,62 +392,79 @@ class TibiaAdapter(GameAdapter):
             log.error("tibia_adapter.input_error", error=str(e), action=action.action_type)
             return False
 
+    # Heartbeat callers poll detect_game_window(); one lookup per window
+    WINDOW_CACHE_TTL = 10.0
+
     async def detect_game_window(self) -> bool:
-        """Detect if Tibia is running."""
+        """Detect if Tibia is running (cached for WINDOW_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        checked_at = self._window_checked_at
+        if checked_at is not None and now - checked_at < self.WINDOW_CACHE_TTL:
+            return self._window_found
+        self._window_found = await self._detect_game_window()
+        self._window_checked_at = now
+        return self._window_found
+
+    async def _detect_game_window(self) -> bool:
+        """Uncached window/process lookup (never blocks the event loop)."""
         if sys.platform == "win32":
             try:
-                import ctypes
-                user32 = ctypes.windll.user32
-
-                def enum_cb(hwnd, results):
-                    if user32.IsWindowVisible(hwnd):
-                        length = user32.GetWindowTextLengthW(hwnd)
-                        if length > 0:
-                            buf = ctypes.create_unicode_buffer(length + 1)
-                            user32.GetWindowTextW(hwnd, buf, length + 1)
-                            if "tibia" in buf.value.lower():
-                                results.append(hwnd)
-                    return True
-
-                results = []
-                WNDENUMPROC = ctypes.WINFUNCTYPE(
-                    ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)
-                )
-                user32.EnumWindows(WNDENUMPROC(enum_cb), 0)
-                self._window_found = len(results) > 0
-                return self._window_found
-
+                # EnumWindows calls back into Python per window — keep it
+                # off the loop thread
+                return await asyncio.to_thread(self._find_window_win32)
             except Exception:
                 pass
 
         elif sys.platform == "darwin":
             try:
-                import subprocess
-                result = subprocess.run(
-                    ["osascript", "-e",
-                     'tell application "System Events" to get name of every process '
-                     'whose name contains "Tibia"'],
-                    capture_output=True, text=True, timeout=5,
+                stdout = await self._run_probe(
+                    "osascript", "-e",
+                    'tell application "System Events" to get name of every process '
+                    'whose name contains "Tibia"',
                 )
-                self._window_found = "Tibia" in result.stdout
-                return self._window_found
+                return stdout is not None and b"Tibia" in stdout
             except Exception:
                 pass
 
         # Fallback: check processes
         try:
-            import subprocess
-            result = subprocess.run(
-                ["pgrep", "-i", "tibia"],
-                capture_output=True, text=True, timeout=5,
-            )
-            self._window_found = result.returncode == 0
-            return self._window_found
+            return await self._run_probe("pgrep", "-i", "tibia") is not None
         except Exception:
             pass
 
         return False
 
+    def _find_window_win32(self) -> bool:
+        """Look for a visible Tibia window via user32 (blocking)."""
+        user32 = _USER32
+
+        # Fast path: one exact-title lookup, no window enumeration
+        title = (self._config.get("perception", {})
+                 .get("capture", {}).get("game_window_title", "Tibia"))
+        if user32.FindWindowW(None, title):
+            return True
+
+        # Logged-in clients are titled "Tibia - <character>" — scan
+        _enum_hits.found = False
+        user32.EnumWindows(_ENUM_TIBIA_CB, 0)
+        return _enum_hits.found
+
+    @staticmethod
+    async def _run_probe(*cmd: str, timeout: float = 5.0) -> Optional[bytes]:
+        """Run a lookup command; stdout on exit code 0, else None."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return stdout if proc.returncode == 0 else None
+
     def get_default_config(self) -> dict:
         """Return default Tibia configuration."""
         return {
@@ -270,7 +475,7 @@ class TibiaAdapter(GameAdapter):
             },
             "perception": {
                 "capture": {
-                    "method": "dxcam" if sys.platform == "win32" else "screenshot",
+                    "backend": "dxcam" if sys.platform == "win32" else "mss",
                     "fps": 30,
                     "game_window_title": "Tibia",
                 },
@@ -346,11 +551,11 @@ class TibiaAdapter(GameAdapter):
             "skill_bar": (400, 900, 800, 40),
         }
 
-    def translate_action(self, abstract_action: str, params: dict) -> list[InputAction]:
-        """Translate abstract actions into Tibia-specific inputs."""
+    def _build_translations(self) -> None:
+        """Precompute the parameter-free action translations from config."""
         hotkeys = self._config.get("reactive", {}).get("hotkeys", {})
 
-        translations = {
+        self._translations = {
             "heal_critical": [InputAction(
                 action_type="key_press",
                 key=hotkeys.get("heal_critical", "F1"),
@@ -371,16 +576,22 @@ class TibiaAdapter(GameAdapter):
             "move_south": [InputAction(action_type="key_press", key="down")],
             "move_east": [InputAction(action_type="key_press", key="right")],
             "move_west": [InputAction(action_type="key_press", key="left")],
-            "loot": [InputAction(
+        }
+
+    def translate_action(self, abstract_action: str, params: dict) -> list[InputAction]:
+        """Translate abstract actions into Tibia-specific inputs.
+
+        Static translations are shared between calls; do not mutate them.
+        """
+        if abstract_action == "loot":
+            return [InputAction(
                 action_type="mouse_click",
                 key="right",
                 x=params.get("x", 0),
                 y=params.get("y", 0),
                 modifiers=["shift"],
-            )],
-        }
-
-        return translations.get(abstract_action, [])
+            )]
+        return self._translations.get(abstract_action, _NO_ACTIONS)
 
     def get_skill_template(self) -> str:
         """Return a YAML template for creating Tibia hunting skills."""
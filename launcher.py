@@ -14,13 +14,13 @@ from __future__ import annotations
 import os
 import sys
 import subprocess
+from importlib.util import find_spec
 from pathlib import Path
 
 NEXUS_HOME = Path.home() / ".nexus"
 
 
-def print_startup():
-    print("""
+BANNER = """
     ╔═══════════════════════════════════════════╗
     ║                                           ║
     ║   ███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗   ║
@@ -33,7 +33,15 @@ def print_startup():
     ║        Autonomous Gaming Agent v0.5.0     ║
     ║                                           ║
     ╚═══════════════════════════════════════════╝
-    """)
+
+"""
+
+
+def print_startup():
+    """Show the banner — interactive terminals only, unless NEXUS_QUIET is set."""
+    if sys.stdout.isatty() and not os.environ.get("NEXUS_QUIET"):
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
 
 
 def check_python():
@@ -45,8 +53,22 @@ def check_python():
         sys.exit(1)
 
 
+DEPS_SENTINEL = NEXUS_HOME / ".deps_ok"
+
+
 def check_dependencies():
-    """Auto-install missing dependencies."""
+    """Auto-install missing dependencies.
+
+    After one successful check the interpreter path is written to
+    DEPS_SENTINEL; later boots with the same interpreter skip the imports.
+    Delete the file to force a re-check.
+    """
+    try:
+        if DEPS_SENTINEL.read_text().strip() == sys.executable:
+            return
+    except OSError:
+        pass
+
     required = [
         ("cv2", "opencv-python"),
         ("yaml", "pyyaml"),
@@ -58,21 +80,25 @@ def check_dependencies():
         ("pynput", "pynput"),
     ]
 
-    missing = []
-    for module, package in required:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(package)
+    # Locate without importing — the real imports happen where used
+    missing = [package for module, package in required if find_spec(module) is None]
 
     if missing:
         print(f"  Installing: {', '.join(missing)}")
-        subprocess.run([
+        result = subprocess.run([
             sys.executable, "-m", "pip", "install", *missing,
             "--quiet", "--disable-pip-version-check",
         ])
+        if result.returncode != 0:
+            return
         print("  Done!\n")
 
+    try:
+        NEXUS_HOME.mkdir(parents=True, exist_ok=True)
+        DEPS_SENTINEL.write_text(sys.executable)
+    except OSError:
+        pass
+
 
 def check_config():
     """Create config from example if it doesn't exist."""
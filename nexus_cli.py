@@ -21,23 +21,32 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import os
 import sys
-import json
 import signal
 import time
+from importlib.util import find_spec
+
+# Perception already parallelises across frames (capture/reader tasks plus a
+# 2-worker pool); BLAS/OpenMP spawning a thread per core on top of that only
+# oversubscribes the CPU. Must run before numpy/cv2 are first imported.
+# Users can still override any of these from the environment.
+for _var in ("OMP_THREAD_LIMIT", "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
 
 import click
-import structlog
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+# asyncio, structlog and the agent stack are imported inside the commands
+# that need them, so `nexus --help` / `version` / `status` start fast
+
+# Piped/redirected output gets no colour anyway (Rich detects that), so
+# skip the per-print highlighter regexes and the ASCII-art banner there too
+_TTY = sys.stdout.isatty()
+console = Console(highlight=_TTY)
 
 try:
     from importlib.metadata import version as _pkg_version
@@ -45,12 +54,15 @@ try:
 except Exception:
     VERSION = "0.4.2"  # Fallback when not installed as package
 NEXUS_HOME = Path.home() / ".nexus"
-PID_FILE = NEXUS_HOME / "nexus.pid"
+PID_FILE = NEXUS_HOME / "nexus.pid"  # Locked for as long as an agent runs
 CONFIG_FILE = NEXUS_HOME / "config.yaml"
+SKILLS_INDEX = NEXUS_HOME / "skills_index.pkl"
+SKILL_FIELDS = ("name", "game", "category", "score", "waypoints", "version")
+ENV_CACHE = NEXUS_HOME / "env_cache.json"
+ENV_CACHE_TTL = 86400  # seconds
 
 
-def get_banner() -> str:
-    return """[bold cyan]
+BANNER = """[bold cyan]
     ███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗
     ████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝
     ██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗
@@ -61,18 +73,40 @@ def get_banner() -> str:
     [dim]Autonomous Gaming Agent v{version}[/dim]
     [dim]Dual-Brain AI · Self-Improving · Always Learning[/dim]
 """.format(version=VERSION)
+BANNER_PLAIN = f"NEXUS — Autonomous Gaming Agent v{VERSION}"
+
+
+def get_banner() -> str:
+    return BANNER if _TTY else BANNER_PLAIN
 
 
 def setup_logging(debug: bool = False):
     """Configure structured logging."""
+    import structlog
+
     level = 10 if debug else 20
+
+    # Pretty console output for people; one JSON object per line when piped
+    # to a file/journal, which is far cheaper per event than ConsoleRenderer
+    logger_factory = structlog.PrintLoggerFactory()
+    if debug or _TTY:
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+    elif find_spec("orjson") is not None:
+        import orjson
+        renderer = structlog.processors.JSONRenderer(
+            serializer=orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY)
+        logger_factory = structlog.BytesLoggerFactory()  # orjson emits bytes
+    else:
+        renderer = structlog.processors.JSONRenderer()
+
     structlog.configure(
         processors=[
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.add_log_level,
-            structlog.dev.ConsoleRenderer(colors=True),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=logger_factory,
     )
 
 
@@ -84,8 +118,142 @@ def ensure_home_dir():
     (NEXUS_HOME / "skills").mkdir(exist_ok=True)
 
 
+# ─── PID file ───────────────────────────────────────────
+# A running agent holds an exclusive lock on PID_FILE; the OS drops it when
+# the process exits, however it exits. "Is an agent running?" is therefore
+# "is the file locked?", and a leftover file is never stale. The file is
+# never unlinked or replaced: either would let a second agent lock a fresh
+# inode while the first still holds the old one.
+
+_WIN_LOCK_OFFSET = 1 << 16  # msvcrt locks are mandatory; keep them off the PID bytes
+
+
+def _try_lock(fd: int) -> bool:
+    """False if another process holds the lock; other failures raise OSError."""
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            os.lseek(fd, _WIN_LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+    except OSError as e:
+        import errno
+        if sys.platform == "win32" and e.errno in (errno.EACCES, errno.EDEADLOCK):
+            return False
+        raise
+
+
+def _unlock(fd: int):
+    if sys.platform == "win32":
+        import msvcrt
+        os.lseek(fd, _WIN_LOCK_OFFSET, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def acquire_pid_file() -> Optional[int]:
+    """
+    Lock PID_FILE and record our PID in it.
+
+    Returns the open fd, which must stay open while the agent runs,
+    or None if another agent already holds the lock.
+    """
+    NEXUS_HOME.mkdir(parents=True, exist_ok=True)
+    fd = os.open(PID_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+    if not _try_lock(fd):
+        os.close(fd)
+        return None
+    os.ftruncate(fd, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.write(fd, str(os.getpid()).encode())
+    os.fsync(fd)
+    return fd
+
+
+def release_pid_file(fd: int):
+    """Clear our PID and drop the lock (exiting the process does the same)."""
+    try:
+        os.ftruncate(fd, 0)
+        _unlock(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def running_agent() -> tuple[bool, Optional[int]]:
+    """
+    (running, pid) of the agent holding PID_FILE's lock.
+
+    running is False when no agent holds the lock, whatever the file says.
+    pid is None when an agent is running but its PID couldn't be read.
+    Raises OSError if the file exists but can't be opened or locked.
+    """
+    try:
+        fd = os.open(PID_FILE, os.O_RDONLY)  # flock needs no write access
+    except FileNotFoundError:
+        return False, None
+    try:
+        if _try_lock(fd):
+            _unlock(fd)
+            return False, None
+        # Locked: an agent is running. Its PID lands right after the lock,
+        # so allow one short retry if we caught it in between.
+        for _ in range(2):
+            os.lseek(fd, 0, os.SEEK_SET)
+            data = os.read(fd, 32).strip()
+            if data.isdigit():
+                return True, int(data)
+            time.sleep(0.05)
+        return True, None
+    finally:
+        os.close(fd)
+
+
 def check_environment() -> list[str]:
-    """Check for required dependencies and environment."""
+    """Check for required dependencies and environment.
+
+    A clean result is cached in ENV_CACHE for a day, keyed by the interpreter
+    path, its mtime and version, so repeat `start`/`status` calls skip the
+    probes. Failing results are always re-checked (the user may have just
+    installed the missing package).
+    """
+    import json
+    try:
+        key = [sys.executable, os.stat(sys.executable).st_mtime_ns, sys.version]
+    except OSError:
+        key = None
+
+    if key is not None:
+        try:
+            cached = json.loads(ENV_CACHE.read_text())
+            if (cached["key"] == key and not cached["issues"]
+                    and time.time() - cached["last_check_ts"] < ENV_CACHE_TTL):
+                return []
+        except Exception:
+            pass
+
+    issues = _probe_environment()
+
+    if key is not None:
+        try:
+            NEXUS_HOME.mkdir(parents=True, exist_ok=True)
+            ENV_CACHE.write_text(json.dumps(
+                {"key": key, "last_check_ts": time.time(), "issues": issues}))
+        except OSError:
+            pass
+
+    return issues
+
+
+def _probe_environment() -> list[str]:
     issues = []
 
     if sys.version_info < (3, 11):
@@ -99,10 +267,10 @@ def check_environment() -> list[str]:
         ("aiohttp", "aiohttp"),
     ]
 
+    # find_spec only locates the module — it doesn't execute it (cv2 alone
+    # takes hundreds of ms to import)
     for module, package in required:
-        try:
-            __import__(module)
-        except ImportError:
+        if find_spec(module) is None:
             issues.append(f"Missing: {package}")
 
     return issues
@@ -157,8 +325,16 @@ def start(config, game, tui, dashboard, debug, port):
         console.print(f"  Or create a config at: {config}")
         sys.exit(1)
 
-    # Write PID file
-    PID_FILE.write_text(str(os.getpid()))
+    # Lock the PID file — fails if another agent is already running
+    try:
+        pid_fd = acquire_pid_file()
+    except OSError as e:
+        console.print(f"[red]Cannot lock {PID_FILE}:[/red] {e}")
+        sys.exit(1)
+    if pid_fd is None:
+        console.print("[yellow]NEXUS is already running.[/yellow] "
+                      "Use [cyan]nexus stop[/cyan] first.")
+        sys.exit(1)
 
     try:
         if tui:
@@ -182,17 +358,18 @@ def start(config, game, tui, dashboard, debug, port):
             if dashboard:
                 console.print(f"  [green]✓[/green] Dashboard: [cyan]http://127.0.0.1:{port}[/cyan]")
             console.print()
+            import asyncio
             asyncio.run(_run_agent(config, game, dashboard, port))
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Shutting down gracefully...[/yellow]")
     finally:
-        if PID_FILE.exists():
-            PID_FILE.unlink()
+        release_pid_file(pid_fd)
 
 
 async def _run_agent(config_path: str, game: str, with_dashboard: bool, port: int):
     """Internal: Run the agent with all systems."""
+    import asyncio
     from core.agent import NexusAgent
     from dashboard.server import DashboardServer
 
@@ -203,23 +380,31 @@ async def _run_agent(config_path: str, game: str, with_dashboard: bool, port: in
         dashboard_server = DashboardServer(agent, port=port)
         await dashboard_server.start()
 
-    loop = asyncio.get_event_loop()
-
-    def signal_handler():
-        asyncio.create_task(_shutdown(agent, dashboard_server))
-
+    # Signals only set an event; shutdown then runs exactly once, below
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(sig, signal_handler)
-        except NotImplementedError:
-            signal.signal(sig, lambda s, f: signal_handler())
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: no loop signal handlers
+            signal.signal(sig, lambda s, f: loop.call_soon_threadsafe(stop.set))
 
+    agent_task = asyncio.create_task(agent.start())
+    stop_task = asyncio.create_task(stop.wait())
     try:
-        await agent.start()
+        await asyncio.wait({agent_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
     except asyncio.CancelledError:
         pass
     finally:
+        stop_task.cancel()
         await _shutdown(agent, dashboard_server)
+        if not agent_task.done():
+            agent_task.cancel()
+        await asyncio.gather(agent_task, return_exceptions=True)
+
+    # Surface a crash in the agent itself (after the clean shutdown)
+    if not agent_task.cancelled() and agent_task.exception() is not None:
+        raise agent_task.exception()
 
 
 async def _shutdown(agent, dashboard_server):
@@ -239,17 +424,23 @@ async def _shutdown(agent, dashboard_server):
 @cli.command()
 def stop():
     """Stop a running NEXUS agent."""
-    if not PID_FILE.exists():
+    try:
+        running, pid = running_agent()
+    except OSError as e:
+        console.print(f"[red]Cannot check {PID_FILE}:[/red] {e}")
+        sys.exit(1)
+    if not running:
         console.print("[yellow]No running agent found.[/yellow]")
         return
+    if pid is None:
+        console.print(f"[red]An agent is running, but its PID could not be read from {PID_FILE}.[/red]")
+        sys.exit(1)
 
-    pid = int(PID_FILE.read_text().strip())
     try:
         os.kill(pid, signal.SIGTERM)
         console.print(f"[green]Sent stop signal to NEXUS (PID {pid})[/green]")
     except ProcessLookupError:
-        console.print("[yellow]Agent process not found (stale PID file).[/yellow]")
-        PID_FILE.unlink()
+        console.print("[yellow]Agent process already exited.[/yellow]")
     except PermissionError:
         console.print("[red]Permission denied. Try with sudo.[/red]")
 
@@ -260,16 +451,17 @@ def status():
     console.print(get_banner())
 
     # Check if running
-    if PID_FILE.exists():
-        pid = int(PID_FILE.read_text().strip())
-        try:
-            os.kill(pid, 0)  # Check if process exists
-            console.print(f"  [green]● RUNNING[/green] (PID {pid})")
-        except ProcessLookupError:
-            console.print(f"  [red]● STOPPED[/red] (stale PID)")
-            PID_FILE.unlink()
+    try:
+        running, pid = running_agent()
+    except OSError as e:
+        console.print(f"  [yellow]● UNKNOWN[/yellow] (cannot check {PID_FILE}: {e})")
     else:
-        console.print(f"  [dim]● NOT RUNNING[/dim]")
+        if not running:
+            console.print(f"  [dim]● NOT RUNNING[/dim]")
+        elif pid is None:
+            console.print(f"  [green]● RUNNING[/green] (PID unreadable)")
+        else:
+            console.print(f"  [green]● RUNNING[/green] (PID {pid})")
 
     console.print()
 
@@ -307,7 +499,7 @@ def status():
     # Skills
     skills_dir = Path("skills")
     if skills_dir.exists():
-        yaml_count = len(list(skills_dir.rglob("*.yaml")))
+        yaml_count = sum(1 for _ in _iter_yaml(skills_dir))
         console.print(f"  [green]✓[/green] Skills: {yaml_count} loaded")
 
     console.print()
@@ -328,9 +520,8 @@ def calibrate(config):
     console.print("[cyan]Starting calibration...[/cyan]\n")
 
     async def _calibrate():
-        import yaml
-        with open(config) as f:
-            cfg = yaml.safe_load(f)
+        from core.config import load_yaml_cached
+        cfg = load_yaml_cached(config)
 
         from perception.screen_capture import ScreenCapture
         capture = ScreenCapture(cfg["perception"])
@@ -349,6 +540,7 @@ def calibrate(config):
         else:
             console.print("[red]✗[/red] Game window not found. Is Tibia running?")
 
+    import asyncio
     asyncio.run(_calibrate())
 
 
@@ -359,38 +551,134 @@ def skills():
 
 
 @skills.command("list")
-def skills_list():
+@click.option("--json", "as_json", is_flag=True, help="One JSON object per skill (JSON Lines)")
+@click.option("--plain", is_flag=True, help="CSV rows with a header line")
+def skills_list(as_json, plain):
     """List all available skills."""
     skills_dir = Path("skills")
     if not skills_dir.exists():
-        console.print("[yellow]No skills directory found.[/yellow]")
+        if as_json or plain:
+            click.echo("No skills directory found.", err=True)
+        else:
+            console.print("[yellow]No skills directory found.[/yellow]")
         return
 
-    table = Table(title="NEXUS Skills", border_style="cyan")
-    table.add_column("Name", style="bold")
-    table.add_column("Game", style="cyan")
-    table.add_column("Category")
-    table.add_column("Score", justify="right")
-    table.add_column("Waypoints", justify="right")
-    table.add_column("Version")
+    # Machine modes skip Rich and write each row as soon as it is read,
+    # so `nexus skills list --json | jq ...` streams
+    if as_json:
+        import json
+
+        def emit(row):
+            click.echo(json.dumps(dict(zip(SKILL_FIELDS, row))))
+    elif plain:
+        import csv
+        writer = csv.writer(sys.stdout)
+        writer.writerow(SKILL_FIELDS)
+        emit = writer.writerow
+    else:
+        table = Table(title="NEXUS Skills", border_style="cyan")
+        table.add_column("Name", style="bold")
+        table.add_column("Game", style="cyan")
+        table.add_column("Category")
+        table.add_column("Score", justify="right")
+        table.add_column("Waypoints", justify="right")
+        table.add_column("Version")
+
+        def emit(row):
+            table.add_row(*row)
+
+    # Rows come from an mtime-keyed index; only new/changed files are parsed
+    index = _load_skills_index()
+    fresh = {}
+    for entry in sorted(_iter_yaml(skills_dir), key=lambda e: e.path):
+        try:
+            emit(_skill_row(entry, index, fresh))
+        except Exception:
+            pass
+
+    if fresh != index:  # Something was parsed, added or deleted
+        _save_skills_index(fresh)
+
+    if not (as_json or plain):
+        console.print(table)
+
 
-    import yaml
-    for path in sorted(skills_dir.rglob("*.yaml")):
+def _iter_yaml(root: Path):
+    """
+    Yield an os.DirEntry for every *.yaml file under root.
+
+    scandir reports entry types with the listing, so unlike rglob no
+    per-entry stat() is needed to tell files from directories. Symlinked
+    directories are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-            table.add_row(
-                data.get("name", "?"),
-                data.get("game", "?"),
-                data.get("category", "?"),
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".yaml"):
+                    yield entry
+
+
+def _load_skills_index() -> dict:
+    """{path: (mtime_ns, size, row)} from SKILLS_INDEX, or empty."""
+    import pickle
+    try:
+        with open(SKILLS_INDEX, "rb") as f:
+            index = pickle.load(f)
+        return index if isinstance(index, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_skills_index(index: dict):
+    import pickle
+    try:
+        NEXUS_HOME.mkdir(parents=True, exist_ok=True)
+        with open(SKILLS_INDEX, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def _skill_row(entry: os.DirEntry, index: dict, fresh: dict) -> tuple:
+    """
+    Table row for one skill file (a DirEntry), re-parsed only when its
+    mtime/size changed.
+
+    The index record used goes into ``fresh`` (the next index). Raises on
+    unreadable/invalid skills — the caller skips those rows.
+    """
+    key = os.path.abspath(entry.path)
+    st = entry.stat()
+    cached = index.get(key)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when built
+        try:
+            with open(entry) as f:
+                data = yaml.load(f, Loader=loader)
+            # All str: Rich refuses to render e.g. an unquoted `version: 1.2`
+            row = (
+                str(data.get("name", "?")),
+                str(data.get("game", "?")),
+                str(data.get("category", "?")),
                 f"{data.get('performance_score', 50):.0f}",
                 str(len(data.get("waypoints", []))),
-                data.get("version", "1.0"),
+                str(data.get("version", "1.0")),
             )
         except Exception:
-            pass
-
-    console.print(table)
+            row = None  # Remember the failure too, until the file changes
+        cached = (st.st_mtime_ns, st.st_size, row)
+    fresh[key] = cached
+    if cached[2] is None:
+        raise ValueError(f"invalid skill file: {entry.path}")
+    return cached[2]
 
 
 @skills.command("create")
@@ -444,7 +732,11 @@ def dashboard_only(port):
     import webbrowser
     url = f"http://127.0.0.1:{port}"
 
-    if PID_FILE.exists():
+    try:
+        running, _pid = running_agent()
+    except OSError:
+        running = True  # Can't tell — let the browser find out
+    if running:
         console.print(f"[green]Opening dashboard:[/green] {url}")
         webbrowser.open(url)
     else:
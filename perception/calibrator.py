@@ -20,19 +20,110 @@ Methods:
     4. MANUAL FALLBACK: User clicks corners of each region
 
 The calibrator runs ONCE at startup and saves results to config.
+Results are memoized in ~/.nexus/calibration_cache.json keyed by a
+thumbnail hash of the frame, so an unchanged screen skips detection.
+A calibrator instance that is re-run (watch mode) first re-finds each
+previous region by template matching near its last position, and only
+runs the full detector for regions that moved or changed.
+
+Detectors run at full resolution on purpose: HP/mana bars are only
+5-15px tall, so a 2x pyrDown would push thin bars under the size gates
+and blend bar pixels with the frame border, breaking the channel-margin
+colour tests. Each detector already takes ~3-5ms on a 2560x1440 frame.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 import numpy as np
 import cv2
 import structlog
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
+from pathlib import Path
 
 log = structlog.get_logger()
 
+CALIBRATION_CACHE = Path.home() / ".nexus" / "calibration_cache.json"
+_CACHE_MAX_ENTRIES = 32
+
+# Incremental re-detection: search radius around the previous box, minimum
+# TM_CCOEFF_NORMED score to accept, and context kept around each template
+# (a bare bar fill is a flat patch, which has no correlation to match on).
+# An unchanged HUD scores ~1.0; at 0.9 a flat bar shifted by a pixel along
+# its length still passed, hence the tighter threshold
+_TRACK_RADIUS = 20
+_TRACK_MIN_SCORE = 0.98
+_TEMPLATE_PAD = 4
+
+
+def frame_signature(frame: np.ndarray) -> str:
+    """Resolution + blake2b of a 64x36 area-averaged thumbnail."""
+    h, w = frame.shape[:2]
+    thumb = cv2.resize(frame, (64, 36), interpolation=cv2.INTER_AREA)
+    return f"{w}x{h}:{hashlib.blake2b(thumb.tobytes(), digest_size=16).hexdigest()}"
+
+
+def _load_cache() -> dict:
+    try:
+        return json.loads(CALIBRATION_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict):
+    # Keep only the newest entries (dicts preserve insertion order)
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    try:
+        CALIBRATION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CALIBRATION_CACHE.write_text(json.dumps(cache))
+    except OSError as e:
+        log.debug("calibrator.cache_write_failed", error=str(e))
+
+
+def _over(channel: np.ndarray, thresh: int) -> np.ndarray:
+    """uint8 mask: 255 where ``channel > thresh`` (cv2.threshold, SIMD)."""
+    return cv2.threshold(channel, thresh, 255, cv2.THRESH_BINARY)[1]
+
+
+def _under(channel: np.ndarray, thresh: int) -> np.ndarray:
+    """uint8 mask: 255 where ``channel < thresh``."""
+    return cv2.threshold(channel, thresh - 1, 255, cv2.THRESH_BINARY_INV)[1]
+
+
+def _best_bar_box(mask: np.ndarray) -> Optional[tuple[int, int, int, int]]:
+    """
+    Most bar-shaped blob in a uint8 mask as (x, y, w, h), or None.
+
+    Bars are wide and thin (aspect > 4) and reasonably sized; among those,
+    the largest bbox_area * aspect wins (prefer wider, thinner bars).
+    One connectedComponentsWithStats call yields every blob's bounding
+    box, so the filtering is a few array ops instead of a contour loop.
+    """
+    _n, _labels, stats, _centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    stats = stats[1:]  # Label 0 is the background
+    if len(stats) == 0:
+        return None
+
+    cw = stats[:, cv2.CC_STAT_WIDTH]
+    ch = stats[:, cv2.CC_STAT_HEIGHT]
+    aspect = cw / np.maximum(ch, 1)
+    area = cw * ch  # Bounding-box area, not pixel count
+
+    ok = (aspect > 4) & (cw > 60) & (cw < 400) & (ch > 4) & (ch < 25) & (area > 300)
+    score = np.where(ok, area * aspect, 0.0)
+    # Ties go to the bottom-most blob (last label), as findContours'
+    # reverse scan order used to pick
+    i = len(score) - 1 - int(np.argmax(score[::-1]))
+    if score[i] <= 0:
+        return None
+    x, y, w, h = stats[i, :4]
+    return int(x), int(y), int(w), int(h)
+
 
 @dataclass
 class CalibratedRegion:
@@ -68,41 +159,81 @@ class ScreenCalibrator:
 
     def __init__(self):
         self._detected_regions: dict[str, CalibratedRegion] = {}
+        # Previous run, for incremental re-detection: region boxes, and per
+        # region (gray template, box offset inside the template)
+        self._last_shape: Optional[tuple] = None
+        self._last_regions: dict[str, dict] = {}
+        self._last_templates: dict[str, tuple[np.ndarray, int, int]] = {}
 
-    def auto_detect(self, frame: np.ndarray) -> dict[str, dict]:
+    def auto_detect(self, frame: np.ndarray, use_cache: bool = True) -> dict[str, dict]:
         """
         Auto-detect all UI regions from a single game screenshot.
 
         Returns dict of region_name → {x, y, w, h} ready for config.
+        With use_cache, a frame whose signature was seen before returns the
+        stored result without running any detector. On repeat calls, regions
+        still found near their previous position skip their detector.
         """
         if frame is None:
             return {}
 
         h, w = frame.shape[:2]
+
+        key = frame_signature(frame) if use_cache else None
+        if key is not None:
+            cache = _load_cache()
+            cached = cache.get(key)
+            if cached is not None:
+                log.info("calibrator.cache_hit", frame_size=f"{w}x{h}",
+                         names=list(cached.keys()))
+                self._remember(frame, cached)
+                return cached
+
         log.info("calibrator.starting", frame_size=f"{w}x{h}")
 
+        if frame.shape != self._last_shape:
+            self._last_templates = {}  # Resolution changed: nothing to track
+
         results = {}
 
-        # 1. Detect HP bar (red horizontal bar in top-left area)
-        hp_region = self._find_hp_bar(frame)
+        def detect(name, find, *args):
+            return self._track(frame, name) or find(frame, *args)
+
+        # The battle list and minimap both scan the right-hand panel in HSV;
+        # convert it once and let each take a view of its part (unless both
+        # are expected to be re-found by tracking — they convert on a miss).
+        # Converting into a kept dst= buffer measured no faster than a fresh
+        # array (the allocator reuses the freed block), so none is kept.
+        panel_hsv = None
+        if not {"battle_list", "minimap"} <= self._last_templates.keys():
+            panel_hsv = cv2.cvtColor(frame[:, self._panel_x(w):], cv2.COLOR_BGR2HSV)
+
+        # The detectors only read the frame and spend their time in cv2
+        # calls that release the GIL, so the independent ones run in
+        # parallel. Only the mana bar waits, since it searches below the HP bar.
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="calibrator") as pool:
+            # 1. HP bar (red horizontal bar in top-left area)
+            hp_future = pool.submit(detect, "hp_bar", self._find_hp_bar)
+            # 3. Battle list (right side panel with creature entries)
+            battle_future = pool.submit(detect, "battle_list", self._find_battle_list, panel_hsv)
+            # 4. Minimap (top-right square with colored terrain)
+            minimap_future = pool.submit(detect, "minimap", self._find_minimap, panel_hsv)
+
+            hp_region = hp_future.result()
+            # 2. Mana bar (blue bar, usually right below HP)
+            mana_region = detect("mana_bar", self._find_mana_bar, hp_region)
+            battle_region = battle_future.result()
+            minimap_region = minimap_future.result()
+
         if hp_region:
             results["hp_bar"] = hp_region
             log.info("calibrator.found_hp_bar", **hp_region)
-
-        # 2. Detect Mana bar (blue bar, usually right below HP)
-        mana_region = self._find_mana_bar(frame, hp_region)
         if mana_region:
             results["mana_bar"] = mana_region
             log.info("calibrator.found_mana_bar", **mana_region)
-
-        # 3. Detect battle list (right side panel with creature entries)
-        battle_region = self._find_battle_list(frame)
         if battle_region:
             results["battle_list"] = battle_region
             log.info("calibrator.found_battle_list", **battle_region)
-
-        # 4. Detect minimap (top-right square with colored terrain)
-        minimap_region = self._find_minimap(frame)
         if minimap_region:
             results["minimap"] = minimap_region
             log.info("calibrator.found_minimap", **minimap_region)
@@ -115,8 +246,72 @@ class ScreenCalibrator:
         log.info("calibrator.complete", regions_found=len(results),
                  names=list(results.keys()))
 
+        self._remember(frame, results)
+
+        if key is not None:
+            # Plain ints — detectors may return numpy scalars
+            cache[key] = {name: {k: int(v) for k, v in region.items()}
+                          for name, region in results.items()}
+            _save_cache(cache)
+
         return results
 
+    def _remember(self, frame: np.ndarray, regions: dict[str, dict]):
+        """Keep each region's box and a padded grayscale template of it."""
+        fh, fw = frame.shape[:2]
+        self._last_shape = frame.shape
+        self._last_regions = {}
+        self._last_templates = {}
+        for name, r in regions.items():
+            if name == "game_screen":  # Derived from the others, not matched
+                continue
+            x, y, w, h = int(r["x"]), int(r["y"]), int(r["w"]), int(r["h"])
+            x0, y0 = max(x - _TEMPLATE_PAD, 0), max(y - _TEMPLATE_PAD, 0)
+            x1, y1 = min(x + w + _TEMPLATE_PAD, fw), min(y + h + _TEMPLATE_PAD, fh)
+            if x1 - x0 <= 0 or y1 - y0 <= 0:
+                continue
+            template = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+            if template.std() < 1.0:  # Flat patch: correlation is undefined
+                continue
+            self._last_regions[name] = {"x": x, "y": y, "w": w, "h": h}
+            self._last_templates[name] = (template, x - x0, y - y0)
+
+    def _track(self, frame: np.ndarray, name: str) -> Optional[dict]:
+        """
+        Re-find a previously detected region within ±_TRACK_RADIUS px of its
+        last position via matchTemplate. None if there is no template or the
+        best match scores below _TRACK_MIN_SCORE (run the full detector then).
+        """
+        entry = self._last_templates.get(name)
+        if entry is None:
+            return None
+        template, dx, dy = entry
+        prev = self._last_regions[name]
+        th, tw = template.shape
+        fh, fw = frame.shape[:2]
+
+        tx, ty = prev["x"] - dx, prev["y"] - dy
+        x0, y0 = max(tx - _TRACK_RADIUS, 0), max(ty - _TRACK_RADIUS, 0)
+        x1, y1 = min(tx + tw + _TRACK_RADIUS, fw), min(ty + th + _TRACK_RADIUS, fh)
+        if x1 - x0 < tw or y1 - y0 < th:
+            return None
+
+        search = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        scores = cv2.matchTemplate(search, template, cv2.TM_CCOEFF_NORMED)
+        _min, best, _minloc, (mx, my) = cv2.minMaxLoc(scores)
+        if not best >= _TRACK_MIN_SCORE:  # Also rejects NaN
+            return None
+        # A best match on the rim of the search window (not clipped by the
+        # frame edge) may be a partial overlap with a region that moved
+        # further — a bar slid along its own length still correlates well
+        max_y, max_x = scores.shape[0] - 1, scores.shape[1] - 1
+        if (mx == 0 and x0 > 0) or (mx == max_x and x1 < fw) \
+                or (my == 0 and y0 > 0) or (my == max_y and y1 < fh):
+            return None
+
+        log.debug("calibrator.tracked", region=name, score=round(best, 3))
+        return {"x": x0 + mx + dx, "y": y0 + my + dy, "w": prev["w"], "h": prev["h"]}
+
     def _find_hp_bar(self, frame: np.ndarray) -> Optional[dict]:
         """
         Find HP bar by scanning for a horizontal colored bar in the top-left quadrant.
@@ -135,40 +330,33 @@ class ScreenCalibrator:
         # Scan top-left quadrant only
         search_region = frame[:int(h * 0.3), :int(w * 0.5)]
 
-        r = search_region[:, :, 2].astype(np.int16)
-        g = search_region[:, :, 1].astype(np.int16)
-        b = search_region[:, :, 0].astype(np.int16)
+        # All on uint8 — saturating cv2.subtract/add keep the comparisons
+        # exact (g - r > 30 ⇔ sat(g - r) > 30; r + g > 250 ⇔ sat(r + g) > 250)
+        # without widening three channels to int16.
+        # A fused single-pass numba kernel for this mask was measured at
+        # parity (1.2-1.7ms vs 1.5-1.8ms at 1080p/1440p) — these cv2 ops are
+        # already SIMD — and connectedComponentsWithStats costs as much again,
+        # so it isn't worth a second code path; this runs once per calibration.
+        b, g, r = cv2.split(search_region)
+        sub, add = cv2.subtract, cv2.add
 
         # Detect ALL possible HP bar colors:
         # Green (full HP): G dominant
-        green_mask = (g > 120) & (g > r + 30) & (g > b + 30)
+        green_mask = _over(g, 120) & _over(sub(g, r), 30) & _over(sub(g, b), 30)
         # Red (low HP): R dominant
-        red_mask = (r > 120) & (r > g + 30) & (r > b + 30)
+        red_mask = _over(r, 120) & _over(sub(r, g), 30) & _over(sub(r, b), 30)
         # Yellow/Orange (medium HP): R and G both high, B low
-        yellow_mask = (r > 100) & (g > 80) & (b < 80) & (r + g > 250)
+        yellow_mask = _over(r, 100) & _over(g, 80) & _under(b, 80) & _over(add(r, g), 250)
 
         # Combined: any HP bar colored pixel
-        hp_bar_mask = (green_mask | red_mask | yellow_mask).astype(np.uint8) * 255
-
-        # Find contours of colored regions
-        contours, _ = cv2.findContours(hp_bar_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        hp_bar_mask = green_mask | red_mask | yellow_mask
 
-        # Find the most bar-shaped contour (wide, thin)
-        best = None
-        best_score = 0
-        for cnt in contours:
-            x, y, cw, ch = cv2.boundingRect(cnt)
-            aspect = cw / max(ch, 1)
-            area = cw * ch
-
-            # HP bar should be wide and thin (aspect > 5) and reasonably sized
-            if aspect > 4 and 60 < cw < 400 and 4 < ch < 25 and area > 300:
-                score = area * aspect  # Prefer wider, thinner bars
-                if score > best_score:
-                    best_score = score
-                    best = {"x": x, "y": y, "w": cw, "h": ch}
-
-        return best
+        # Find the most bar-shaped colored blob (wide, thin)
+        box = _best_bar_box(hp_bar_mask)
+        if box is None:
+            return None
+        x, y, cw, ch = box
+        return {"x": x, "y": y, "w": cw, "h": ch}
 
     def _find_mana_bar(self, frame: np.ndarray, hp_region: Optional[dict]) -> Optional[dict]:
         """
@@ -193,33 +381,27 @@ class ScreenCalibrator:
             return None
 
         # Mana bar is blue/purple — B channel dominant
-        r = search_region[:, :, 2].astype(np.int16)
-        g = search_region[:, :, 1].astype(np.int16)
-        b = search_region[:, :, 0].astype(np.int16)
-        blue_mask = ((b > 100) & (b > r + 30) & (b > g + 30)).astype(np.uint8) * 255
-
-        contours, _ = cv2.findContours(blue_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-        best = None
-        best_score = 0
-        for cnt in contours:
-            x, y, cw, ch = cv2.boundingRect(cnt)
-            aspect = cw / max(ch, 1)
-            area = cw * ch
-
-            if aspect > 4 and 60 < cw < 400 and 4 < ch < 25 and area > 300:
-                score = area * aspect
-                if score > best_score:
-                    best_score = score
-                    best = {
-                        "x": search_x_start + x,
-                        "y": search_y_start + y,
-                        "w": cw, "h": ch,
-                    }
-
-        return best
-
-    def _find_battle_list(self, frame: np.ndarray) -> Optional[dict]:
+        b, g, r = cv2.split(search_region)
+        blue_mask = (_over(b, 100) & _over(cv2.subtract(b, r), 30)
+                     & _over(cv2.subtract(b, g), 30))
+
+        box = _best_bar_box(blue_mask)
+        if box is None:
+            return None
+        x, y, cw, ch = box
+        return {
+            "x": search_x_start + x,
+            "y": search_y_start + y,
+            "w": cw, "h": ch,
+        }
+
+    @staticmethod
+    def _panel_x(w: int) -> int:
+        """Left edge of the right-hand panel (right 40% of the frame)."""
+        return int(w * 0.6)
+
+    def _find_battle_list(self, frame: np.ndarray,
+                          panel_hsv: Optional[np.ndarray] = None) -> Optional[dict]:
         """
         Find battle list by looking for the panel on the right side
         with multiple small horizontal HP bars (creature entries).
@@ -228,10 +410,12 @@ class ScreenCalibrator:
         - Right side of screen (right 30%)
         - Contains multiple small green/yellow/red bars
         - Panel width ~150-200px
+
+        panel_hsv: HSV of frame[:, _panel_x(w):], if already converted.
         """
         h, w = frame.shape[:2]
         # Scan right 40% of screen
-        search_x_start = int(w * 0.6)
+        search_x_start = self._panel_x(w)
         search_region = frame[:, search_x_start:]
 
         if search_region.size == 0:
@@ -239,29 +423,32 @@ class ScreenCalibrator:
 
         # Look for columns with many small colored bars
         # Convert to HSV to find saturated (colored) pixels
-        hsv = cv2.cvtColor(search_region, cv2.COLOR_BGR2HSV)
+        hsv = panel_hsv if panel_hsv is not None else cv2.cvtColor(search_region, cv2.COLOR_BGR2HSV)
         colored_mask = (hsv[:, :, 1] > 80).astype(np.uint8) * 255
 
-        # Find vertical strips with high density of colored pixels
-        col_density = np.sum(colored_mask, axis=0) / (h * 255)
+        # Find vertical strips with high density of colored pixels:
+        # SIMD column sums into int32 (each colored pixel adds 255)
+        col_sum = cv2.reduce(colored_mask, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel()
 
-        # Find region where density is consistently high (battle list panel)
-        threshold = 0.05
-        high_density_cols = col_density > threshold
+        # Find region where density is consistently high (battle list panel):
+        # col_sum / (h * 255) > 0.05, kept in integers
+        high_density_cols = col_sum * 20 > h * 255
         if not np.any(high_density_cols):
             return None
 
-        # Find contiguous region of high density
-        changes = np.diff(high_density_cols.astype(int))
-        starts = np.where(changes == 1)[0]
-        ends = np.where(changes == -1)[0]
+        # Find contiguous region of high density: edge i sits between
+        # columns i and i + 1; a rising edge opens a run, a falling one ends it
+        edges = np.flatnonzero(high_density_cols[1:] ^ high_density_cols[:-1])
+        rising = high_density_cols[edges + 1]
+        starts = edges[rising]
+        ends = edges[~rising]
 
         if len(starts) == 0:
             return None
 
         # Take the widest contiguous region
         if len(ends) == 0:
-            ends = np.array([len(col_density) - 1])
+            ends = np.array([len(col_sum) - 1])
         if starts[0] > ends[0]:
             starts = np.insert(starts, 0, 0)
 
@@ -285,10 +472,13 @@ class ScreenCalibrator:
             "h": int(h * 0.5),  # Battle list is typically top half
         }
 
-    def _find_minimap(self, frame: np.ndarray) -> Optional[dict]:
+    def _find_minimap(self, frame: np.ndarray,
+                      panel_hsv: Optional[np.ndarray] = None) -> Optional[dict]:
         """
         Find minimap by looking for a roughly square colored region
         in the top-right area with terrain-like colors (green, brown, blue).
+
+        panel_hsv: HSV of frame[:, _panel_x(w):], if already converted.
         """
         h, w = frame.shape[:2]
         # Minimap is typically in the top-right corner
@@ -299,39 +489,61 @@ class ScreenCalibrator:
             return None
 
         # Minimap has many distinct colors (terrain). Calculate color variance.
-        hsv = cv2.cvtColor(search_region, cv2.COLOR_BGR2HSV)
+        if panel_hsv is not None:  # A view — colour conversion is per pixel
+            hsv = panel_hsv[:int(h * 0.3), search_x_start - self._panel_x(w):]
+        else:
+            hsv = cv2.cvtColor(search_region, cv2.COLOR_BGR2HSV)
 
-        # Look for square-ish region with high hue variance (many terrain colors)
-        block_size = 10
+        # Look for square-ish region with high hue variance (many terrain colors).
+        # Candidate windows sit on a 20px grid (top-left corners) in 4 sizes;
+        # integral images give every window's hue/saturation sums in four
+        # lookups, so all candidates are scored at once instead of per block
+        # (a std over sliding_window_view would still read size² pixels per window).
         sh, sw = search_region.shape[:2]
+        ys = np.arange(0, sh - 80, 20)[:, None]
+        xs = np.arange(0, sw - 80, 20)[None, :]
+        if ys.size == 0 or xs.size == 0:
+            return None
 
-        best_score = 0
-        best_region = None
-
-        # Scan with 20px steps for efficiency
-        for by in range(0, sh - 80, 20):
-            for bx in range(0, sw - 80, 20):
-                # Test different minimap sizes (80-130px square)
-                for size in [80, 100, 110, 120]:
-                    if by + size > sh or bx + size > sw:
-                        continue
-
-                    block = hsv[by:by + size, bx:bx + size]
-                    hue_std = np.std(block[:, :, 0])
-                    sat_mean = np.mean(block[:, :, 1])
-
-                    # Minimap has high hue variety and moderate saturation
-                    score = hue_std * sat_mean / 100
-                    if score > best_score and hue_std > 20:
-                        best_score = score
-                        best_region = {
-                            "x": search_x_start + bx,
-                            "y": by,
-                            "w": size,
-                            "h": size,
-                        }
-
-        return best_region
+        sum_h, sqsum_h = cv2.integral2(hsv[:, :, 0], sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        sum_s = cv2.integral(hsv[:, :, 1], sdepth=cv2.CV_64F)
+
+        # Test different minimap sizes (80-130px square)
+        sizes = (80, 100, 110, 120)
+        scores = np.empty((ys.shape[0], xs.shape[1], len(sizes)))
+        for k, size in enumerate(sizes):
+            y1 = np.minimum(ys + size, sh)
+            x1 = np.minimum(xs + size, sw)
+            area = size * size
+
+            def window_sum(ii: np.ndarray) -> np.ndarray:
+                return ii[y1, x1] - ii[ys, x1] - ii[y1, xs] + ii[ys, xs]
+
+            hue_sum = window_sum(sum_h)
+            # Population std from integer sums (exact in float64 at these sizes)
+            hue_std = np.sqrt(np.maximum(area * window_sum(sqsum_h) - hue_sum * hue_sum, 0.0)) / area
+            sat_mean = window_sum(sum_s) / area
+
+            # Minimap has high hue variety and moderate saturation
+            score = hue_std * sat_mean / 100
+            valid = (ys + size <= sh) & (xs + size <= sw) & (hue_std > 20)
+            scores[:, :, k] = np.where(valid, score, 0.0)
+
+        # argmax returns the first maximum in (y, x, size) order — same
+        # tie-breaking as the original nested scan. No early exit on a
+        # "good enough" score: all windows cost a few array ops together,
+        # and stopping early would pick a different window than the best
+        best = int(np.argmax(scores))
+        if scores.flat[best] <= 0:
+            return None
+        iy, ix, k = np.unravel_index(best, scores.shape)
+        size = sizes[k]
+        return {
+            "x": search_x_start + int(xs[0, ix]),
+            "y": int(ys[iy, 0]),
+            "w": size,
+            "h": size,
+        }
 
     def _estimate_game_screen(self, frame: np.ndarray, found: dict) -> Optional[dict]:
         """Estimate the main game viewport based on other detected regions."""
@@ -30,7 +30,7 @@ import numpy as np
 import cv2
 import structlog
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from core.state import GameState, CreatureState
 from core.state.models import CombatLogEntry
@@ -41,6 +41,167 @@ log = structlog.get_logger()
 _PERCEPTION_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="perception")
 
 
+class _Rect(NamedTuple):
+    """A screen region resolved once: geometry plus ready-made frame slices."""
+    x: int
+    y: int
+    w: int
+    h: int
+    rows: slice  # frame[rows, cols] == frame[y:y + h, x:x + w]
+    cols: slice
+
+
+def _mid_rows(y: int, h: int) -> slice:
+    """Up to 3 rows around the middle of a bar (avoids single-pixel noise)."""
+    mid_y = y + h // 2
+    return slice(max(y, mid_y - 1), min(y + h, mid_y + 2))
+
+
+def read_hp_bar(bar: np.ndarray) -> int:
+    """
+    Filled pixel count of the best row in a BGR HP-bar slice (rows, w, 3).
+
+    One vectorized pass over all sampled rows: a single int16 widening,
+    the colour masks, then a per-row count_nonzero.
+
+    Tibia HP bar color by health level:
+        100% = bright GREEN
+        ~75% = YELLOW-GREEN
+        ~50% = YELLOW
+        ~25% = ORANGE
+        ~10% = RED
+        0%   = DARK (empty/black)
+
+    ANY bright colored pixel counts as "filled" — the unfilled
+    portion is dark background (~30-50 brightness).
+    """
+    px = bar.astype(np.int16)
+    b, g, r = px[..., 0], px[..., 1], px[..., 2]
+    # Green (full HP): G is dominant and bright
+    is_green = (g > 100) & (g > r + 20) & (g > b + 20)
+    # Red (low HP): R is dominant and bright
+    is_red = (r > 100) & (r > g + 20) & (r > b + 20)
+    # Yellow/Orange (medium HP): R and G both high, B low
+    is_yellow = (r > 80) & (g > 60) & (b < 80) & ((r + g) > 200)
+    filled = is_green | is_red | is_yellow
+    return int(np.count_nonzero(filled, axis=-1).max()) if filled.size else 0
+
+
+def read_mana_bar(bar: np.ndarray) -> int:
+    """Filled pixel count of the best row in a BGR mana-bar slice (blue dominant)."""
+    px = bar.astype(np.int16)
+    b, g, r = px[..., 0], px[..., 1], px[..., 2]
+    filled = (b > 80) & (b > r + 20) & (b > g + 20)
+    return int(np.count_nonzero(filled, axis=-1).max()) if filled.size else 0
+
+
+def _count_hp_bar(bar: np.ndarray) -> int:
+    """read_hp_bar() as one loop over the pixels, no temporaries (numba kernel)."""
+    best = 0
+    for y in range(bar.shape[0]):
+        filled = 0
+        for x in range(bar.shape[1]):
+            b = np.int32(bar[y, x, 0])
+            g = np.int32(bar[y, x, 1])
+            r = np.int32(bar[y, x, 2])
+            if ((g > 100 and g > r + 20 and g > b + 20)
+                    or (r > 100 and r > g + 20 and r > b + 20)
+                    or (r > 80 and g > 60 and b < 80 and r + g > 200)):
+                filled += 1
+        best = max(best, filled)
+    return best
+
+
+def _count_mana_bar(bar: np.ndarray) -> int:
+    """read_mana_bar() as one loop over the pixels (numba kernel)."""
+    best = 0
+    for y in range(bar.shape[0]):
+        filled = 0
+        for x in range(bar.shape[1]):
+            b = np.int32(bar[y, x, 0])
+            g = np.int32(bar[y, x, 1])
+            r = np.int32(bar[y, x, 2])
+            if b > 80 and b > r + 20 and b > g + 20:
+                filled += 1
+        best = max(best, filled)
+    return best
+
+
+def _scan_battle_rows(region: np.ndarray, brightness: np.ndarray,
+                      entry_h: int, hp_x0: int) -> np.ndarray:
+    """
+    Find battle-list entries and read their HP bars.
+
+    An entry starts at the first row brighter than 60; the next search
+    resumes entry_h rows below it. For each entry, the HP bar is the middle
+    row of columns hp_x0: — a pixel counts as filled when its brightest
+    channel exceeds 80.
+
+    Returns an (n, 2) int64 array of (start_row, filled_pixels).
+    """
+    h = brightness.shape[0]
+    bright = (brightness > 60).tolist()
+    found = []
+    row = 0
+    while row < h - entry_h:
+        if bright[row]:
+            mid = region[row + entry_h // 2, hp_x0:]
+            found.append((row, int(np.count_nonzero(mid.max(axis=-1) > 80))))
+            row += entry_h
+        else:
+            row += 1
+    return np.array(found, dtype=np.int64).reshape(-1, 2)
+
+
+def _scan_battle_rows_loop(region: np.ndarray, brightness: np.ndarray,
+                           entry_h: int, hp_x0: int) -> np.ndarray:
+    """_scan_battle_rows() as one C-style loop (numba kernel)."""
+    h = brightness.shape[0]
+    w = region.shape[1]
+    out = np.empty((h // entry_h + 1, 2), dtype=np.int64)
+    n = 0
+    row = 0
+    while row < h - entry_h:
+        if brightness[row] > 60:
+            mid = row + entry_h // 2
+            filled = 0
+            for col in range(hp_x0, w):
+                if max(region[mid, col, 0], region[mid, col, 1], region[mid, col, 2]) > 80:
+                    filled += 1
+            out[n, 0] = row
+            out[n, 1] = filled
+            n += 1
+            row += entry_h
+        else:
+            row += 1
+    return out[:n]
+
+
+# Native, GIL-free versions when numba is available (the "fast" extra); the
+# NumPy readers are the fallback — the *_loop/_count_* sources walk pixels
+# one by one and are only ever run compiled.
+# The slices are small (~3x200 pixels per bar), so the NumPy readers'
+# per-call overhead outweighs their pixel work — a compiled loop is far cheaper.
+# Compile once via warm_kernels() at startup — the first JIT call takes seconds.
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    _scan_battle_rows = njit(nogil=True, cache=True)(_scan_battle_rows_loop)
+    read_hp_bar = njit(nogil=True, cache=True, boundscheck=False)(_count_hp_bar)
+    read_mana_bar = njit(nogil=True, cache=True, boundscheck=False)(_count_mana_bar)
+
+
+def warm_kernels() -> None:
+    """Trigger JIT compilation of the perception kernels on a tiny sample."""
+    sample = np.zeros((24, 16, 3), dtype=np.uint8)
+    # Regions are read as non-contiguous frame slices — compile that layout
+    _scan_battle_rows(sample[:, 2:14], np.full(24, 100.0), 20, 8)
+    read_hp_bar(sample[8:11, 2:14])
+    read_mana_bar(sample[8:11, 2:14])
+
+
 class GameReaderV2:
     """
     Optimized game state reader.
@@ -56,6 +217,9 @@ class GameReaderV2:
         self.state = state
         self.config = config
         self.regions = config.get("screen_regions", config.get("regions", {}))
+        # Resolved regions keyed by name lookup — see _rect(). Cleared by
+        # update_regions(); None caches "not configured"
+        self._rects: dict[tuple[str, ...], Optional[_Rect]] = {}
         self._calibrated = False
 
         # Cache previous values for change detection
@@ -100,6 +264,10 @@ class GameReaderV2:
             log.info("game_reader_v2.start_position_set",
                      x=self._position_x, y=self._position_y, z=self._position_z)
 
+        # JIT-compile the numba kernels (if installed) off the event loop,
+        # so the first process_frame() doesn't stall on compilation
+        await asyncio.to_thread(warm_kernels)
+
         self._calibrated = True
         log.info("game_reader_v2.calibrated",
                  regions=list(self.regions.keys()),
@@ -155,7 +323,9 @@ class GameReaderV2:
         # Priority 5: Kill detection (creatures disappearing from battle list)
         self._detect_kills()
 
-        # Priority 6: Position from minimap (every 3rd frame for perf)
+        # Priority 6: Position from minimap (every 3rd frame for perf).
+        # Gated on the frame counter, not the clock — the minimap diff
+        # tracking is tuned to this 3-frame stride, so keep it (not & 3)
         if self._frame_number % 3 == 0:
             self._read_minimap_position(frame)
 
@@ -167,57 +337,15 @@ class GameReaderV2:
         """
         Read HP from pixel colors. <0.5ms.
 
-        Method: Scan the middle row of the HP bar region.
-        Count colored (non-dark) pixels = filled portion of bar.
-
-        Tibia HP bar color by health level:
-            100% = bright GREEN
-            ~75% = YELLOW-GREEN
-            ~50% = YELLOW
-            ~25% = ORANGE
-            ~10% = RED
-            0%   = DARK (empty/black)
-
-        We detect ANY bright colored pixel as "filled" — the unfilled
-        portion is dark background (~30-50 brightness).
+        Method: count colored (non-dark) pixels in the rows around the
+        middle of the bar = filled portion. See read_hp_bar().
         """
-        region = self.regions.get("health_bar") or self.regions.get("hp_bar")
-        if not region:
-            return
-
-        x, y, w, h = self._unpack_region(region)
-        if w == 0 or h == 0:
-            return
-        if y + h > frame.shape[0] or x + w > frame.shape[1]:
+        rect = self._rect("health_bar", "hp_bar")
+        if rect is None or not self._fits(rect, frame):
             return
+        w = rect.w
 
-        # Sample 3 rows around the middle for robustness (avoid single-pixel noise)
-        mid_y = y + h // 2
-        rows_to_check = [mid_y]
-        if mid_y - 1 >= y:
-            rows_to_check.append(mid_y - 1)
-        if mid_y + 1 < y + h:
-            rows_to_check.append(mid_y + 1)
-
-        best_filled = 0
-        for row_y in rows_to_check:
-            bar_row = frame[row_y, x:x + w]
-            r = bar_row[:, 2].astype(np.int16)
-            g = bar_row[:, 1].astype(np.int16)
-            b = bar_row[:, 0].astype(np.int16)
-
-            # Detect ALL HP bar colors:
-            # Green (full HP): G is dominant and bright
-            is_green = (g > 100) & (g > r + 20) & (g > b + 20)
-            # Red (low HP): R is dominant and bright
-            is_red = (r > 100) & (r > g + 20) & (r > b + 20)
-            # Yellow/Orange (medium HP): R and G both high, B low
-            is_yellow = (r > 80) & (g > 60) & (b < 80) & ((r + g) > 200)
-
-            is_filled = is_green | is_red | is_yellow
-            filled_count = int(np.sum(is_filled))
-            if filled_count > best_filled:
-                best_filled = filled_count
+        best_filled = read_hp_bar(frame[_mid_rows(rect.y, rect.h), rect.cols])
 
         total_pixels = w
         hp_percent = (best_filled / total_pixels * 100) if total_pixels > 0 else 0
@@ -239,36 +367,12 @@ class GameReaderV2:
         Mana bar in Tibia is blue/purple. Unfilled portion is dark.
         We detect blue-dominant bright pixels as "filled".
         """
-        region = self.regions.get("mana_bar")
-        if not region:
+        rect = self._rect("mana_bar")
+        if rect is None or not self._fits(rect, frame):
             return
+        w = rect.w
 
-        x, y, w, h = self._unpack_region(region)
-        if w == 0 or h == 0:
-            return
-        if y + h > frame.shape[0] or x + w > frame.shape[1]:
-            return
-
-        # Sample 3 rows around the middle for robustness
-        mid_y = y + h // 2
-        rows_to_check = [mid_y]
-        if mid_y - 1 >= y:
-            rows_to_check.append(mid_y - 1)
-        if mid_y + 1 < y + h:
-            rows_to_check.append(mid_y + 1)
-
-        best_filled = 0
-        for row_y in rows_to_check:
-            bar_row = frame[row_y, x:x + w]
-            r = bar_row[:, 2].astype(np.int16)
-            g = bar_row[:, 1].astype(np.int16)
-            b = bar_row[:, 0].astype(np.int16)
-
-            # Blue/purple mana bar: B channel dominant
-            is_filled = (b > 80) & (b > r + 20) & (b > g + 20)
-            filled_count = int(np.sum(is_filled))
-            if filled_count > best_filled:
-                best_filled = filled_count
+        best_filled = read_mana_bar(frame[_mid_rows(rect.y, rect.h), rect.cols])
 
         total_pixels = w
         mana_percent = (best_filled / total_pixels * 100) if total_pixels > 0 else 0
@@ -297,77 +401,54 @@ class GameReaderV2:
         2. For each entry, read the HP bar on the right
         3. Detect if it's a player (skull icon check) or creature
         """
-        region = self.regions.get("battle_list")
-        if not region:
-            return
-
-        x, y, w, h = self._unpack_region(region)
-        if w == 0 or h == 0:
-            return
-        if y + h > frame.shape[0] or x + w > frame.shape[1]:
+        rect = self._rect("battle_list")
+        if rect is None or not self._fits(rect, frame):
             return
+        w = rect.w
 
-        battle_region = frame[y:y + h, x:x + w]
+        battle_region = frame[rect.rows, rect.cols]
 
         # Detect entry boundaries by finding horizontal rows with content
         # Background in Tibia's battle list is typically dark gray (~40,40,40)
         gray = cv2.cvtColor(battle_region, cv2.COLOR_BGR2GRAY)
 
-        # Each row: average brightness. Entries are brighter than gaps
-        row_brightness = np.mean(gray, axis=1)
+        # Each row: average brightness. Entries are brighter than gaps.
+        # SIMD int32 row sums (exact) — ~10x cheaper than np.mean(axis=1)
+        row_brightness = cv2.reduce(gray, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() / w
 
-        # Find entry boundaries (transitions from dark to bright)
+        # Find entry boundaries (transitions from dark to bright) and read
+        # each entry's HP bar (right 40%) in one pass
         entry_height = 20  # Approximate height of one battle list entry
+        hp_x0 = int(w * 0.6)
+        hp_total = w - hp_x0
         entries = []
-        row = 0
-
-        while row < h - entry_height:
-            # Check if this row starts an entry (brightness > threshold)
-            if row_brightness[row] > 60:
-                entry_slice = battle_region[row:row + entry_height, :]
-
-                # Read HP bar from this entry (right portion)
-                hp_bar_region = entry_slice[:, int(w * 0.6):]
-                entry_hp = self._read_entry_hp_bar(hp_bar_region)
-
-                # Detect skull (player indicator) — small colored pixel cluster on left
-                skull_region = entry_slice[:, :16]
-                is_player = self._detect_skull(skull_region)
-
-                # Detect if this creature is attacking us (highlighted/flashing entry)
-                is_attacking = self._detect_attacking_indicator(entry_slice)
-
-                entries.append(CreatureState(
-                    name=f"creature_{len(entries)}",
-                    hp_percent=entry_hp,
-                    distance=len(entries),  # Rough: higher in list = closer
-                    is_player=is_player,
-                    is_attacking=is_attacking,
-                    last_seen=time.time(),
-                ))
-
-                row += entry_height
-            else:
-                row += 1
+        now = time.time()  # One timestamp per frame, not per entry
+
+        for row, filled in _scan_battle_rows(battle_region, row_brightness,
+                                             entry_height, hp_x0):
+            entry_slice = battle_region[row:row + entry_height, :]
+            entry_hp = (filled / hp_total * 100) if hp_total > 0 else 100.0
+
+            # Detect skull (player indicator) — small colored pixel cluster on left
+            skull_region = entry_slice[:, :16]
+            is_player = self._detect_skull(skull_region)
+
+            # Detect if this creature is attacking us (highlighted/flashing entry)
+            is_attacking = self._detect_attacking_indicator(entry_slice)
+
+            entries.append(CreatureState(
+                name=f"creature_{len(entries)}",
+                hp_percent=entry_hp,
+                distance=len(entries),  # Rough: higher in list = closer
+                is_player=is_player,
+                is_attacking=is_attacking,
+                last_seen=now,
+            ))
 
         # Always update battle list (even if same count — HP may have changed)
         self.state.update_battle_list(entries)
         self._prev_battle_count = len(entries)
 
-    def _read_entry_hp_bar(self, hp_region: np.ndarray) -> float:
-        """Read HP percentage from a battle list entry's HP bar."""
-        if hp_region.size == 0:
-            return 100.0
-
-        # The HP bar is green (full) → yellow → red (low)
-        # Count non-dark pixels in the middle row
-        mid_row = hp_region[hp_region.shape[0] // 2, :]
-        brightness = np.max(mid_row, axis=1) if mid_row.ndim > 1 else mid_row
-        filled = np.sum(brightness > 80)
-        total = len(brightness)
-
-        return (filled / total * 100) if total > 0 else 100.0
-
     def _detect_skull(self, skull_region: np.ndarray) -> bool:
         """
         Detect if a battle list entry has a skull (player indicator).
@@ -549,18 +630,12 @@ class GameReaderV2:
         - Accumulates drift over time (recalibrated at waypoints)
         - Floor changes need separate detection (handled by navigator)
         """
-        region = self.regions.get("minimap")
-        if not region:
-            return
-
-        x, y, w, h = self._unpack_region(region)
-        if w == 0 or h == 0:
-            return
-        if y + h > frame.shape[0] or x + w > frame.shape[1]:
+        rect = self._rect("minimap")
+        if rect is None or not self._fits(rect, frame):
             return
 
         # Extract minimap and convert to grayscale float (required for phaseCorrelate)
-        minimap = frame[y:y + h, x:x + w]
+        minimap = frame[rect.rows, rect.cols]
         minimap_gray = cv2.cvtColor(minimap, cv2.COLOR_BGR2GRAY).astype(np.float64)
 
         if self._prev_minimap is not None and self._prev_minimap.shape == minimap_gray.shape:
@@ -612,6 +687,37 @@ class GameReaderV2:
     #  Utilities
     # ═══════════════════════════════════════════════════════
 
+    def update_regions(self, regions: dict):
+        """Merge new region definitions (e.g. from auto-calibration)."""
+        self.regions.update(regions)
+        self._rects.clear()
+
+    def _rect(self, *names: str) -> Optional[_Rect]:
+        """
+        Resolve the first configured region among ``names`` (cached).
+
+        Unpacking and slice construction happen once per region instead of
+        once per frame. Returns None when unset or zero-sized.
+        """
+        try:
+            return self._rects[names]
+        except KeyError:
+            pass
+
+        rect = None
+        region = next((self.regions[n] for n in names if self.regions.get(n)), None)
+        if region:
+            x, y, w, h = self._unpack_region(region)
+            if w and h:
+                rect = _Rect(x, y, w, h, slice(y, y + h), slice(x, x + w))
+        self._rects[names] = rect
+        return rect
+
+    @staticmethod
+    def _fits(rect: _Rect, frame: np.ndarray) -> bool:
+        """Whether the region lies inside the frame."""
+        return rect.y + rect.h <= frame.shape[0] and rect.x + rect.w <= frame.shape[1]
+
     def _unpack_region(self, region) -> tuple[int, int, int, int]:
         """Unpack a region definition into (x, y, w, h)."""
         if isinstance(region, dict):
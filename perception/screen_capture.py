@@ -95,31 +95,65 @@ class ScreenCapture:
             return None
 
         try:
-            if self.backend == "dxcam":
-                frame = await self._capture_dxcam()
-            else:
-                frame = await self._capture_mss()
+            frame = await self._grab()
 
             # Cache frame for vision loop
             if frame is not None:
                 self._last_frame = frame
 
-            # Track FPS (thread-safe)
-            with self._fps_lock:
-                self._frame_count += 1
-                elapsed = time.time() - self._fps_timer
-                if elapsed >= 5.0:  # Log FPS every 5 seconds
-                    actual_fps = self._frame_count / elapsed
-                    log.debug("screen_capture.fps", actual=round(actual_fps, 1), target=self.fps)
-                    self._frame_count = 0
-                    self._fps_timer = time.time()
+            self._count_frame()
+            return frame
+
+        except Exception as e:
+            log.error("screen_capture.error", error=str(e))
+            return None
+
+    async def capture_into(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Capture a frame into a caller-owned buffer (no per-frame allocation).
 
+        Returns ``out`` when the frame fits it. On the first call (``out`` is
+        None) or after a window resize, returns a newly allocated frame the
+        caller should adopt as its buffer. None if capture failed.
+        """
+        if not self._initialized:
+            return None
+
+        try:
+            raw = await self._grab()
+            if raw is None:
+                return None
+            if out is not None and out.shape == raw.shape:
+                np.copyto(out, raw)
+                frame = out
+            else:
+                frame = np.ascontiguousarray(raw)
+
+            self._last_frame = frame
+            self._count_frame()
             return frame
 
         except Exception as e:
             log.error("screen_capture.error", error=str(e))
             return None
 
+    async def _grab(self) -> Optional[np.ndarray]:
+        """Grab from the active backend (may be a view into backend memory)."""
+        if self.backend == "dxcam":
+            return await self._capture_dxcam()
+        return await self._capture_mss()
+
+    def _count_frame(self):
+        """Track FPS (thread-safe)."""
+        with self._fps_lock:
+            self._frame_count += 1
+            elapsed = time.time() - self._fps_timer
+            if elapsed >= 5.0:  # Log FPS every 5 seconds
+                actual_fps = self._frame_count / elapsed
+                log.debug("screen_capture.fps", actual=round(actual_fps, 1), target=self.fps)
+                self._frame_count = 0
+                self._fps_timer = time.time()
+
     async def _capture_dxcam(self) -> Optional[np.ndarray]:
         """Capture using dxcam."""
         if self._game_window_region:
@@ -130,9 +164,6 @@ class ScreenCapture:
 
     async def _capture_mss(self) -> Optional[np.ndarray]:
         """Capture using mss."""
-        import mss
-        import numpy as np
-
         monitor = self._camera.monitors[self.monitor_index + 1]  # mss uses 1-indexed
 
         if self._game_window_region:
@@ -145,9 +176,8 @@ class ScreenCapture:
             }
 
         screenshot = self._camera.grab(monitor)
-        frame = np.array(screenshot)
-        # mss returns BGRA, convert to BGR
-        return frame[:, :, :3]
+        # mss returns BGRA; view the screenshot's buffer (no copy) as BGR
+        return np.asarray(screenshot)[:, :, :3]
 
     def set_game_window(self, left: int, top: int, right: int, bottom: int):
         """Set the game window region for targeted capture."""
@@ -14,6 +14,15 @@ from unittest.mock import AsyncMock, MagicMock
 from core.state.game_state import GameState
 from core.state.enums import AgentMode, ThreatLevel
 from core.event_bus import EventBus
+import core.config
+
+
+@pytest.fixture(autouse=True)
+def yaml_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-YAML cache out of the developer's ~/.nexus."""
+    cache = tmp_path / "yaml_cache"
+    monkeypatch.setattr(core.config, "YAML_CACHE_DIR", cache)
+    return cache
 
 
 @pytest.fixture
@@ -0,0 +1,65 @@
+"""
+NEXUS — CLI tests.
+
+Validates: skills listing and PID-file based agent detection.
+"""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+import nexus_cli
+
+
+@pytest.fixture
+def nexus_home(tmp_path, monkeypatch):
+    """Point every ~/.nexus path the CLI uses at a temp dir."""
+    home = tmp_path / ".nexus"
+    monkeypatch.setattr(nexus_cli, "NEXUS_HOME", home)
+    monkeypatch.setattr(nexus_cli, "PID_FILE", home / "nexus.pid")
+    monkeypatch.setattr(nexus_cli, "SKILLS_INDEX", home / "skills_index.pkl")
+    return home
+
+
+class TestSkillsList:
+
+    def test_numeric_fields_are_listed(self, tmp_path, nexus_home, monkeypatch):
+        """A skill with an unquoted numeric version must not break the listing."""
+        skills = tmp_path / "skills"
+        skills.mkdir()
+        (skills / "numeric.yaml").write_text("name: Numeric\ngame: tibia\nversion: 1.2\n")
+        (skills / "broken.yaml").write_text("name: [unclosed\n")
+        monkeypatch.chdir(tmp_path)
+
+        for args in ([], ["--plain"]):
+            result = CliRunner().invoke(nexus_cli.cli, ["skills", "list", *args])
+            assert result.exit_code == 0, result.output
+            assert "Numeric" in result.output
+            assert "1.2" in result.output
+
+
+class TestPidFile:
+
+    def test_acquire_then_detect(self, nexus_home):
+        """While the PID file is locked, the agent is reported running with our PID."""
+        import os
+
+        assert nexus_cli.running_agent() == (False, None)
+        fd = nexus_cli.acquire_pid_file()
+        try:
+            assert fd is not None
+            assert nexus_cli.running_agent() == (True, os.getpid())
+        finally:
+            nexus_cli.release_pid_file(fd)
+        assert nexus_cli.running_agent() == (False, None)
+
+    def test_stale_file_without_lock(self, nexus_home):
+        """A leftover PID file that nobody holds locked means no agent is running."""
+        nexus_home.mkdir(parents=True)
+        (nexus_home / "nexus.pid").write_text("999999")
+        assert nexus_cli.running_agent() == (False, None)
+
+        result = CliRunner().invoke(nexus_cli.cli, ["stop"])
+        assert result.exit_code == 0
+        assert "No running agent" in result.output
@@ -9,7 +9,7 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from core.config import NexusConfig, load_config, config_to_dict
+from core.config import NexusConfig, load_config, config_to_dict, load_yaml_cached
 
 
 class TestConfigDefaults:
@@ -77,3 +77,13 @@ class TestConfigLoader:
         d = config_to_dict(config)
         assert d["agent"]["character_name"] == "Roundtrip"
         assert isinstance(d["ai"]["max_tokens"], int)
+
+    def test_yaml_cache_invalidated_by_edit(self, tmp_path):
+        """Cached YAML must be re-parsed as soon as the file content changes."""
+        cfg = tmp_path / "settings.yaml"
+        cfg.write_text("agent:\n  character_name: First\n")
+        assert load_yaml_cached(cfg)["agent"]["character_name"] == "First"
+        assert load_yaml_cached(cfg)["agent"]["character_name"] == "First"  # From cache
+
+        cfg.write_text("agent:\n  character_name: Second\n")
+        assert load_yaml_cached(cfg)["agent"]["character_name"] == "Second"
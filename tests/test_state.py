@@ -65,3 +65,29 @@ def test_creature_state():
     assert creature.name == "Dragon Lord"
     assert creature.hp_percent == 85
     assert creature.is_player is False
+
+
+def test_version_bumps_on_update():
+    """Every notified mutation should advance GameState.version."""
+    state = GameState()
+    v0 = state.version
+    state.update_hp(50, 100)
+    state.update_position(100, 200, 7)
+    assert state.version == v0 + 2
+
+    state.set_mode(AgentMode.IDLE)  # Same mode = no-op, no bump
+    assert state.version == v0 + 2
+
+
+def test_version_bumps_on_direct_write():
+    """Plain attribute writes the TUI displays must advance version too."""
+    state = GameState()
+    v0 = state.version
+    state.active_skill = "cyclops_hunt"
+    state.current_target = CreatureState(name="Cyclops", hp_percent=80, distance=2)
+    state.is_alive = False
+    state.update_session_rates(120000.0, 15000.0)
+    assert state.version == v0 + 4
+
+    state.active_skill = "cyclops_hunt"  # Unchanged value, no bump
+    assert state.version == v0 + 4
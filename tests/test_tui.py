@@ -0,0 +1,143 @@
+"""
+NEXUS — TUI tests.
+
+Validates: agent event handoff into the shared event buffer, in-place
+TUIState refresh from a live GameState, battle-list change detection,
+and demo fast-forward step ordering.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.event_bus import Event, EventType
+from core.state.game_state import GameState
+from dashboard.tui import NexusTUI
+from dashboard.tui_models import BattleEntry, DemoSimulator, TUIState
+from dashboard.tui_widgets import BattleListWidget
+
+
+def _agent(state):
+    """Minimal live-agent stand-in: update_from_agent reads the rest defensively."""
+    return SimpleNamespace(state=state, _game_id="tibia")
+
+
+class TestEventHandoff:
+
+    def test_events_drained_into_shared_buffer(self):
+        """Queued agent events land newest-first in the buffer the live state shares."""
+        app = NexusTUI(agent=SimpleNamespace())
+        app._demo_mode = False
+        assert app._live_state.events is app._event_buffer
+
+        app._on_agent_event(Event(EventType.KILL, {"creature": "Cyclops"}))
+        app._on_agent_event(Event(EventType.HP_CHANGED, {"new": 50}))  # Noisy, dropped
+        app._on_agent_event(Event(EventType.DEATH, {"cause": "Dragon"}))
+        assert not app._event_buffer  # Nothing formatted until the UI loop drains
+
+        app._drain_events()
+        assert list(app._live_state.events) == ["death: Dragon", "kill: Cyclops"]
+        assert app._event_q.empty()
+
+    def test_buffer_is_bounded(self):
+        """The shared buffer keeps only the newest 50 lines."""
+        app = NexusTUI(agent=SimpleNamespace())
+        app._demo_mode = False
+        for i in range(60):
+            app._on_agent_event(Event(EventType.KILL, {"creature": f"Rat {i}"}))
+        app._drain_events()
+        assert len(app._event_buffer) == 50
+        assert app._event_buffer[0] == "kill: Rat 59"
+
+
+class TestUpdateFromAgent:
+
+    def test_refresh_in_place_picks_up_changes(self):
+        """The long-lived TUIState is updated in place when GameState changes."""
+        game_state = GameState()
+        agent = _agent(game_state)
+        state = TUIState()
+        events = state.events
+        state.update_from_agent(agent)
+        assert state.hp == 100
+        assert state.active_skill == "None"
+
+        game_state.update_hp(40, 100)
+        game_state.active_skill = "cyclops_hunt"
+        state.update_from_agent(agent)
+        assert state.hp == 40
+        assert state.active_skill == "cyclops_hunt"
+        assert state.events is events  # Same instance, same buffer
+
+    def test_unchanged_version_skips_rebuild(self):
+        """Within the TTL an unchanged version leaves the state untouched."""
+        game_state = GameState()
+        agent = _agent(game_state)
+        state = TUIState()
+        state.update_from_agent(agent)
+        game_state.hp = 10  # Raw write, no version bump
+        state.update_from_agent(agent)
+        assert state.hp == 100
+
+
+class TestBattleListWidget:
+
+    @pytest.fixture
+    def widget(self, monkeypatch):
+        w = BattleListWidget()
+        w.refreshes = 0
+
+        def refresh(*args, **kwargs):
+            w.refreshes += 1
+        monkeypatch.setattr(w, "refresh", refresh)
+        return w
+
+    def test_rerenders_when_row_mutated_in_place(self, widget):
+        """Entries are mutated in place upstream — a changed HP must re-render."""
+        battle = [BattleEntry("Cyclops", 80.0, 2, True), BattleEntry("Rat", 50.0, 4)]
+        widget.update_data(battle, target="Cyclops")
+        assert widget.refreshes == 1
+        assert "80%" in widget.render().plain
+
+        widget.update_data(battle, target="Cyclops")
+        assert widget.refreshes == 1  # Same values, no re-render
+
+        battle[0].hp = 35.0
+        widget.update_data(battle, target="Cyclops")
+        assert widget.refreshes == 2
+        text = widget.render().plain
+        assert "35%" in text and "80%" not in text
+        assert text.startswith(" ► Cyclops")
+
+    def test_empty_list(self, widget):
+        widget.update_data([], target=None)
+        assert widget.render().plain == " No creatures"
+
+
+class TestDemoFastForward:
+
+    @staticmethod
+    def _step_kinds(n: int, fast: bool) -> list[str]:
+        sim = DemoSimulator(seed=7)
+        state = sim.initial_state()
+        kinds: list[str] = []
+        sim._event_step = lambda s: kinds.append("event")
+        sim._mode_step = lambda s: kinds.append("mode")
+        if fast:
+            sim.fast_forward(state, n)
+        else:
+            for _ in range(n):
+                sim.tick(state)
+        return kinds
+
+    def test_steps_fire_in_tick_order(self):
+        """Mode steps interleave with event steps exactly as per-tick calls would."""
+        assert self._step_kinds(500, fast=True) == self._step_kinds(500, fast=False)
+
+    def test_long_skip_replays_only_newest_steps(self):
+        """A long offscreen stay replays a bounded tail, still in tick order."""
+        kinds = self._step_kinds(40_000, fast=True)
+        assert len(kinds) == DemoSimulator.MAX_REPLAY_STEPS
+        assert kinds == self._step_kinds(40_000, fast=False)[-len(kinds):]